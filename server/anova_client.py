@@ -141,10 +141,12 @@ class AnovaWebSocketClient:
 
         # Wait for initial connection (with timeout)
         if not self.connected.wait(timeout=self.CONNECTION_TIMEOUT):
-            error_msg = "WebSocket connection timeout"
             if self.connection_error:
-                error_msg = f"WebSocket connection failed: {self.connection_error}"
-            raise AuthenticationError(error_msg)
+                raise AuthenticationError(
+                    f"WebSocket connection failed: {self.connection_error}",
+                    error_code="AUTH_CONNECT_FAILED",
+                )
+            raise AuthenticationError("WebSocket connection timeout", error_code="AUTH_TIMEOUT")
 
         logger.info("AnovaWebSocketClient initialized successfully")
 
@@ -164,7 +166,7 @@ class AnovaWebSocketClient:
         Usage:
             client = AnovaWebSocketClient(config)
             if not client.wait_for_device(timeout=5.0):
-                raise DeviceOfflineError("No device discovered")
+                raise DeviceOfflineError("No device discovered", error_code="NO_DEVICE")
 
         Note:
             - Connection timeout is handled in __init__ (30s)
@@ -259,7 +261,8 @@ class AnovaWebSocketClient:
                     logger.error("Max retries reached, giving up")
                     self.connected.set()  # Unblock init to raise error
                     raise AuthenticationError(
-                        f"Failed to connect after {max_retries} attempts: {e}"
+                        f"Failed to connect after {max_retries} attempts: {e}",
+                        error_code="AUTH_CONNECT_FAILED",
                     ) from e
 
             except Exception as e:
@@ -479,7 +482,7 @@ class AnovaWebSocketClient:
         Reference: Same API as old REST client for compatibility
         """
         if self.selected_device is None:
-            raise DeviceOfflineError("No device connected")
+            raise DeviceOfflineError("No device connected", error_code="NO_DEVICE")
 
         with self.status_lock:
             # Return cached status (updated by event stream)
@@ -532,12 +535,14 @@ class AnovaWebSocketClient:
         Reference: CMD_APC_START from official API
         """
         if self.selected_device is None:
-            raise DeviceOfflineError("No device connected")
+            raise DeviceOfflineError("No device connected", error_code="NO_DEVICE")
 
         # Check if device is already cooking
         status = self.get_status()
         if status["is_running"]:
-            raise DeviceBusyError("Device is already cooking. Stop current cook first.")
+            raise DeviceBusyError(
+                "Device is already cooking. Stop current cook first.", error_code="ALREADY_COOKING"
+            )
 
         # CRITICAL FIX: Get device type with thread-safe access
         with self.devices_lock:
@@ -580,7 +585,7 @@ class AnovaWebSocketClient:
 
                 # Map error codes to appropriate exceptions
                 if error_code == "DEVICE_BUSY":
-                    raise DeviceBusyError(error_message)
+                    raise DeviceBusyError(error_message, error_code="ALREADY_COOKING")
                 elif error_code == "INVALID_TEMPERATURE":
                     from .exceptions import ValidationError
 
@@ -590,7 +595,7 @@ class AnovaWebSocketClient:
 
                     raise ValidationError("INVALID_TIMER", error_message)
                 else:
-                    raise AnovaAPIError(error_message, 500)
+                    raise AnovaAPIError(error_message, 500, error_code=error_code)
 
             # Return response matching API spec (CLAUDE.md Section "API Endpoints Reference")
             return {
@@ -602,7 +607,9 @@ class AnovaWebSocketClient:
 
         except queue.Empty:
             logger.error("Start cook command timeout")
-            raise AnovaAPIError("Start cook command timeout", 504) from None
+            raise AnovaAPIError(
+                "Start cook command timeout", 504, error_code="START_TIMEOUT"
+            ) from None
         finally:
             # CRITICAL FIX: Clean up pending request queue
             with self.pending_lock:
@@ -629,12 +636,12 @@ class AnovaWebSocketClient:
         Reference: CMD_APC_STOP from official API
         """
         if self.selected_device is None:
-            raise DeviceOfflineError("No device connected")
+            raise DeviceOfflineError("No device connected", error_code="NO_DEVICE")
 
         # Check if there's an active cook and capture final temperature
         status = self.get_status()
         if not status["is_running"]:
-            raise NoActiveCookError("No active cook to stop")
+            raise NoActiveCookError("No active cook to stop", error_code="NO_ACTIVE_COOK")
 
         # Capture current temperature before stopping
         final_temp = status["current_temp_celsius"]
@@ -673,9 +680,9 @@ class AnovaWebSocketClient:
                 logger.error(f"Stop cook failed: {error_code} - {error_message}")
 
                 if error_code == "NO_ACTIVE_COOK":
-                    raise NoActiveCookError(error_message)
+                    raise NoActiveCookError(error_message, error_code="NO_ACTIVE_COOK")
                 else:
-                    raise AnovaAPIError(error_message, 500)
+                    raise AnovaAPIError(error_message, 500, error_code=error_code)
 
             # Return response matching API spec (CLAUDE.md Section "API Endpoints Reference")
             return {
@@ -685,7 +692,9 @@ class AnovaWebSocketClient:
 
         except queue.Empty:
             logger.error("Stop cook command timeout")
-            raise AnovaAPIError("Stop cook command timeout", 504) from None
+            raise AnovaAPIError(
+                "Stop cook command timeout", 504, error_code="STOP_TIMEOUT"
+            ) from None
         finally:
             # CRITICAL FIX: Clean up pending request queue
             with self.pending_lock:
@@ -72,18 +72,22 @@ class AnovaAPIError(AnovaServerError):
     Attributes:
         message: Human-readable error message
         status_code: HTTP status code to return (default: 500)
+        error_code: Machine-readable cause set at the raise site
+            (e.g., "NO_DEVICE", "START_TIMEOUT"), or None if not given
     """
 
-    def __init__(self, message: str, status_code: int = 500):
+    def __init__(self, message: str, status_code: int = 500, error_code: str | None = None):
         """
         Initialize AnovaAPIError.
 
         Args:
             message: Human-readable error message
             status_code: HTTP status code to return (default: 500)
+            error_code: Machine-readable cause of the error (default: None)
         """
         self.message = message
         self.status_code = status_code
+        self.error_code = error_code
         super().__init__(message)
 
 
@@ -97,14 +101,17 @@ class DeviceOfflineError(AnovaAPIError):
     The client should retry the request after a delay (suggested: 60 seconds).
     """
 
-    def __init__(self, message: str = "Device is offline or unreachable"):
+    def __init__(
+        self, message: str = "Device is offline or unreachable", error_code: str | None = None
+    ):
         """
         Initialize DeviceOfflineError.
 
         Args:
             message: Human-readable error message
+            error_code: Machine-readable cause of the error (default: None)
         """
-        super().__init__(message, status_code=503)
+        super().__init__(message, status_code=503, error_code=error_code)
 
 
 class AuthenticationError(AnovaAPIError):
@@ -121,14 +128,17 @@ class AuthenticationError(AnovaAPIError):
     - Firebase API key invalid
     """
 
-    def __init__(self, message: str = "Authentication with Anova Cloud failed"):
+    def __init__(
+        self, message: str = "Authentication with Anova Cloud failed", error_code: str | None = None
+    ):
         """
         Initialize AuthenticationError.
 
         Args:
             message: Human-readable error message
+            error_code: Machine-readable cause of the error (default: None)
         """
-        super().__init__(message, status_code=500)
+        super().__init__(message, status_code=500, error_code=error_code)
 
 
 class DeviceBusyError(AnovaAPIError):
@@ -139,14 +149,15 @@ class DeviceBusyError(AnovaAPIError):
     running. Maps to HTTP 409 Conflict.
     """
 
-    def __init__(self, message: str = "Device is already cooking"):
+    def __init__(self, message: str = "Device is already cooking", error_code: str | None = None):
         """
         Initialize DeviceBusyError.
 
         Args:
             message: Human-readable error message
+            error_code: Machine-readable cause of the error (default: None)
         """
-        super().__init__(message, status_code=409)
+        super().__init__(message, status_code=409, error_code=error_code)
 
 
 class NoActiveCookError(AnovaAPIError):
@@ -157,11 +168,12 @@ class NoActiveCookError(AnovaAPIError):
     Maps to HTTP 409 Conflict (device state violation, not resource not found).
     """
 
-    def __init__(self, message: str = "No active cooking session"):
+    def __init__(self, message: str = "No active cooking session", error_code: str | None = None):
         """
         Initialize NoActiveCookError.
 
         Args:
             message: Human-readable error message
+            error_code: Machine-readable cause of the error (default: None)
         """
-        super().__init__(message, status_code=409)
+        super().__init__(message, status_code=409, error_code=error_code)
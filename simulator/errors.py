@@ -64,6 +64,9 @@ class ErrorSimulator:
 
     simulator: Optional["AnovaSimulator"] = None
 
+    # Random source for intermittent failures (pass a seeded Random for repeatable runs)
+    rng: random.Random = field(default_factory=random.Random)
+
     # Active error configurations
     _errors: dict = field(default_factory=dict)
 
@@ -182,7 +185,7 @@ class ErrorSimulator:
         config = self._errors[ErrorType.INTERMITTENT_FAILURE]
         if not config.enabled:
             return False
-        return random.random() < config.failure_rate
+        return self.rng.random() < config.failure_rate
 
     def get_latency(self) -> float:
         """Get current latency in seconds."""
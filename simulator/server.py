@@ -18,6 +18,7 @@ Reference: docs/SIMULATOR-SPECIFICATION.md
 import asyncio
 import logging
 import signal
+from collections.abc import Callable
 
 from .config import Config
 from .control_api import ControlAPI
@@ -82,12 +83,7 @@ class AnovaSimulator:
             self.config.control_port = control_port
 
         # Initialize state
-        self.state = CookerState(
-            cooker_id=self.config.cooker_id,
-            device_type=self.config.device_type,
-            firmware_version=self.config.firmware_version,
-        )
-        self.state.temperature_info.water_temperature = self.config.ambient_temp
+        self.state = self._initial_state()
 
         # Initialize servers
         self.ws_server = WebSocketServer(self.config, self.state)
@@ -99,6 +95,7 @@ class AnovaSimulator:
 
         # Physics task
         self._physics_task: asyncio.Task | None = None
+        self._physics_tick = asyncio.Event()
         self._running = False
 
     def _register_handlers(self):
@@ -175,21 +172,40 @@ class AnovaSimulator:
         logger.info("Simulator stopped")
 
     def reset(self):
-        """Reset simulator to initial state."""
-        self.state.job_status.state = DeviceState.IDLE
-        self.state.job.mode = "IDLE"  # Keep in sync with job_status.state
-        self.state.job.target_temperature = 0.0
-        self.state.job.cook_time_seconds = 0
-        self.state.job_status.cook_time_remaining = 0
-        self.state.temperature_info.water_temperature = self.config.ambient_temp
-        self.state.heater_control.duty_cycle = 0.0
-        self.state.motor_control.duty_cycle = 0.0
-        self.state.motor_info.rpm = 0
-        self.state.pin_info.device_safe = 1
-        self.state.pin_info.water_level_low = 0
-        self.state.pin_info.water_level_critical = 0
+        """
+        Reset simulator to initial state.
+
+        Swaps in a fresh CookerState (shared with the WebSocket server) and
+        clears the message history. Servers, client connections and the physics
+        loop keep running, so a started simulator can be reused between tests.
+        """
+        self.state = self.ws_server.state = self._initial_state()
+        self.ws_server.message_history.clear()
         logger.info("Simulator reset to initial state")
 
+    def _initial_state(self) -> CookerState:
+        """Build the power-on device state: IDLE, online, water at ambient."""
+        state = CookerState(
+            cooker_id=self.config.cooker_id,
+            device_type=self.config.device_type,
+            firmware_version=self.config.firmware_version,
+        )
+        state.temperature_info.water_temperature = self.config.ambient_temp
+        return state
+
+    async def wait_until(self, predicate: Callable[[CookerState], bool]) -> None:
+        """
+        Wait until predicate(state) is true.
+
+        The predicate is re-checked after every physics tick rather than on a
+        fixed polling interval. Wrap in asyncio.wait_for() to bound the wait.
+
+        Args:
+            predicate: Called with the current CookerState
+        """
+        while not predicate(self.state):
+            await self._physics_tick.wait()
+
     # =========================================================================
     # COMMAND HANDLERS
     # =========================================================================
@@ -418,6 +434,10 @@ class AnovaSimulator:
 
                 self._update_physics(dt)
 
+                # Wake wait_until() callers; set() releases every current waiter
+                self._physics_tick.set()
+                self._physics_tick.clear()
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -68,6 +68,9 @@ class WebSocketServer:
         self.message_history: list = []
         self._max_history = 1000
 
+        # EVENT_APC_WIFI_LIST and its serialized form, keyed on the device identity
+        self._device_list_frame: tuple[tuple[str, str, str], dict[str, Any], str] | None = None
+
     def register_handler(self, command: str, handler: Callable):
         """Register a command handler."""
         self._command_handlers[command] = handler
@@ -76,6 +79,9 @@ class WebSocketServer:
         """
         Start the WebSocket server.
 
+        A ws_port of 0 lets the OS pick a free port; the chosen port is written
+        back to config.ws_port.
+
         Args:
             host: Host to bind to
         """
@@ -85,6 +91,8 @@ class WebSocketServer:
             self.config.ws_port,
             process_request=self._process_request,
         )
+        if self.config.ws_port == 0:
+            self.config.ws_port = self.server.sockets[0].getsockname()[1]
         self._running = True
         self._broadcast_task = asyncio.create_task(self._broadcast_loop())
         logger.info(f"WebSocket server started on ws://{host}:{self.config.ws_port}")
@@ -286,9 +294,12 @@ class WebSocketServer:
             )
             await self._send_message(websocket, response)
 
-    async def _send_message(self, websocket: ServerConnection, message: dict[str, Any]):
-        """Send a message to a specific client."""
-        raw = json.dumps(message)
+    async def _send_message(
+        self, websocket: ServerConnection, message: dict[str, Any], raw: str | None = None
+    ):
+        """Send a message to a specific client (raw: message already serialized)."""
+        if raw is None:
+            raw = json.dumps(message)
         self._record_message("outbound", raw)
         logger.info(f"→ SENDING to client: {message.get('command')} (requestId: {message.get('requestId')})")
         await websocket.send(raw)
@@ -300,25 +311,32 @@ class WebSocketServer:
         Called immediately after connection to inform client of available devices.
         This is the first message sent (before EVENT_APC_STATE).
 
+        The list only depends on the device identity, so the serialized frame is
+        built once and reused for every connection until that identity changes.
+
         Args:
             websocket: WebSocket connection to send to
         """
         from .messages import build_event_apc_wifi_list
 
-        # Build device info from current simulator state
-        device_info = {
-            "cookerId": self.state.cooker_id,
-            "type": self.state.device_type,
-            "name": f"Anova {self.state.device_type}",
-            "firmwareVersion": self.state.firmware_version,
-            "online": True,  # Simulator is always online when connected
-        }
+        identity = (self.state.cooker_id, self.state.device_type, self.state.firmware_version)
+        if self._device_list_frame is None or self._device_list_frame[0] != identity:
+            # Build device info from current simulator state
+            device_info = {
+                "cookerId": self.state.cooker_id,
+                "type": self.state.device_type,
+                "name": f"Anova {self.state.device_type}",
+                "firmwareVersion": self.state.firmware_version,
+                "online": True,  # Simulator is always online when connected
+            }
+            event = build_event_apc_wifi_list([device_info])
+            self._device_list_frame = (identity, event, json.dumps(event))
 
         # Send EVENT_APC_WIFI_LIST with device info
-        event = build_event_apc_wifi_list([device_info])
-        await self._send_message(websocket, event)
+        _, event, raw = self._device_list_frame
+        await self._send_message(websocket, event, raw=raw)
 
-        logger.debug(f"Sent device list to client {id(websocket)}: {device_info['cookerId']}")
+        logger.debug(f"Sent device list to client {id(websocket)}: {self.state.cooker_id}")
 
     async def _send_state(self, websocket: ServerConnection):
         """Send current state to a specific client."""
@@ -5,6 +5,7 @@ Test organization:
 - test_validators.py: Unit tests for input validation and food safety
 - test_routes.py: Integration tests for HTTP endpoints
 - test_anova_client.py: Tests for Anova API client with mocks
+- test_mocks.py: Smoke tests for the Anova Cloud API mock fixtures and payloads
 - conftest.py: Shared pytest fixtures
 
 Testing philosophy:
@@ -2,9 +2,11 @@
 Pytest fixtures for mocking Anova Cloud API.
 
 Provides reusable, composable mock fixtures for integration tests.
-All fixtures use @responses.activate to ensure isolation.
+Fixtures only register responses; the calling test must be decorated with
+@responses.activate, which also provides isolation between tests.
 
 Usage:
+    @responses.activate
     def test_something(client, auth_headers, mock_anova_api_success):
         mock_anova_api_success()  # Activate mock
         response = client.post('/start-cook', headers=auth_headers, json={...})
@@ -13,29 +15,79 @@ Usage:
 Reference: tests/mocks/anova_responses.py for mock data
 """
 
+import functools
+import json
+
 import pytest
 import responses
 
+from tests.mocks import anova_responses
 from tests.mocks.anova_responses import (
-    DEVICE_STATUS_COOKING,
-    DEVICE_STATUS_COOKING_ALMOST_DONE,
-    DEVICE_STATUS_DONE,
-    DEVICE_STATUS_IDLE,
-    DEVICE_STATUS_OFFLINE_404,
-    DEVICE_STATUS_PREHEATING,
-    FIREBASE_AUTH_SUCCESS,
     FIREBASE_AUTH_URL,
     FIREBASE_REFRESH_URL,
-    FIREBASE_TOKEN_EXPIRED,
-    FIREBASE_TOKEN_REFRESH_SUCCESS,
-    START_COOK_ALREADY_COOKING,
-    START_COOK_DEVICE_OFFLINE,
-    START_COOK_SUCCESS,
-    STOP_COOK_NOT_COOKING,
-    STOP_COOK_SUCCESS,
     anova_device_url,
 )
 
+# ==============================================================================
+# MOCK RESPONSES
+# ==============================================================================
+
+# Device URLs are built once rather than per responses.add() call
+DEVICE_ID = "test-device-123"
+STATUS_URL = anova_device_url(DEVICE_ID, "status")
+START_URL = anova_device_url(DEVICE_ID, "start")
+STOP_URL = anova_device_url(DEVICE_ID, "stop")
+
+# Payloads are named by anova_responses attribute and only built when a
+# fixture first registers them
+PAYLOADS = {
+    "auth_success": "FIREBASE_AUTH_SUCCESS",
+    "auth_expiring": "FIREBASE_AUTH_SUCCESS",
+    "token_refresh": "FIREBASE_TOKEN_REFRESH_SUCCESS",
+    "token_expired": "FIREBASE_TOKEN_EXPIRED",
+    "idle": "DEVICE_STATUS_IDLE",
+    "preheating": "DEVICE_STATUS_PREHEATING",
+    "cooking": "DEVICE_STATUS_COOKING",
+    "cooking_almost_done": "DEVICE_STATUS_COOKING_ALMOST_DONE",
+    "done": "DEVICE_STATUS_DONE",
+    "offline_404": "DEVICE_STATUS_OFFLINE_404",
+    "start_success": "START_COOK_SUCCESS",
+    "start_already_cooking": "START_COOK_ALREADY_COOKING",
+    "start_device_offline": "START_COOK_DEVICE_OFFLINE",
+    "stop_success": "STOP_COOK_SUCCESS",
+    "stop_not_cooking": "STOP_COOK_NOT_COOKING",
+}
+
+# Fields merged over the base payload for keys that derive from another one
+PAYLOAD_OVERRIDES = {
+    "auth_expiring": {"expiresIn": "0"},  # Expired immediately
+}
+
+
+@functools.cache
+def _encoded_body(json_key: str) -> bytes:
+    """Resolve a PAYLOADS entry and encode it to JSON bytes once per session."""
+    payload = getattr(anova_responses, PAYLOADS[json_key])
+    return json.dumps({**payload, **PAYLOAD_OVERRIDES.get(json_key, {})}).encode()
+
+
+def _mock_response(method: str, url: str, json_key: str, status: int) -> responses.Response:
+    """
+    Build a mock response with a pre-encoded body (bypassing the json= path).
+
+    A new instance is built for every registration: responses keeps
+    call_count and calls on the instance, so sharing one across tests would
+    carry counts over from earlier tests.
+    """
+    return responses.Response(
+        method=method,
+        url=url,
+        body=_encoded_body(json_key),
+        status=status,
+        content_type="application/json",
+    )
+
+
 # ==============================================================================
 # ATOMIC MOCK FIXTURES (Building blocks)
 # ==============================================================================
@@ -46,7 +98,7 @@ def mock_firebase_auth_success():
     """Mock successful Firebase authentication."""
 
     def _add_mock():
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
     return _add_mock
 
@@ -56,9 +108,7 @@ def mock_firebase_token_refresh():
     """Mock successful token refresh."""
 
     def _add_mock():
-        responses.add(
-            responses.POST, FIREBASE_REFRESH_URL, json=FIREBASE_TOKEN_REFRESH_SUCCESS, status=200
-        )
+        responses.add(_mock_response(responses.POST, FIREBASE_REFRESH_URL, "token_refresh", 200))
 
     return _add_mock
 
@@ -68,12 +118,7 @@ def mock_device_status_idle():
     """Mock device in idle state."""
 
     def _add_mock():
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
     return _add_mock
 
@@ -83,12 +128,7 @@ def mock_device_status_preheating():
     """Mock device in preheating state."""
 
     def _add_mock():
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_PREHEATING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "preheating", 200))
 
     return _add_mock
 
@@ -98,12 +138,7 @@ def mock_device_status_cooking():
     """Mock device in cooking state."""
 
     def _add_mock():
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
     return _add_mock
 
@@ -113,12 +148,7 @@ def mock_device_start_cook_success():
     """Mock successful start cook command."""
 
     def _add_mock():
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, START_URL, "start_success", 200))
 
     return _add_mock
 
@@ -128,12 +158,7 @@ def mock_device_stop_cook_success():
     """Mock successful stop cook command."""
 
     def _add_mock():
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "stop"),
-            json=STOP_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, STOP_URL, "stop_success", 200))
 
     return _add_mock
 
@@ -157,50 +182,24 @@ def mock_anova_api_success():
     Use for: Happy path integration tests (INT-01)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # Device idle
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
         # Device status after start (cooking)
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
         # Start cook success
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, START_URL, "start_success", 200))
 
         # Stop cook success
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "stop"),
-            json=STOP_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, STOP_URL, "stop_success", 200))
 
         # Device idle after stop
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
     return _mock
 
@@ -217,25 +216,21 @@ def mock_anova_api_offline():
     Use for: Device offline tests (INT-03, INT-ST-04)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth still works
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # Device offline
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_OFFLINE_404,
-            status=404,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "offline_404", 404))
 
         # Start cook also fails
         responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_DEVICE_OFFLINE,
-            status=503,
+            _mock_response(
+                responses.POST,
+                START_URL,
+                "start_device_offline",
+                503,
+            )
         )
 
     return _mock
@@ -254,25 +249,21 @@ def mock_anova_api_busy():
     Use for: Device busy tests (INT-04)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth succeeds
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # Device status shows cooking
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
         # Start cook rejected
         responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_ALREADY_COOKING,
-            status=409,
+            _mock_response(
+                responses.POST,
+                START_URL,
+                "start_already_cooking",
+                409,
+            )
         )
 
     return _mock
@@ -291,26 +282,15 @@ def mock_anova_api_stop_without_cook():
     Use for: Edge case tests (INT-06)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # Device idle
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
         # Stop rejected (no active cook)
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "stop"),
-            json=STOP_COOK_NOT_COOKING,
-            status=409,
-        )
+        responses.add(_mock_response(responses.POST, STOP_URL, "stop_not_cooking", 409))
 
     return _mock
 
@@ -329,36 +309,18 @@ def mock_token_expired_then_refreshed():
     Use for: Token refresh tests (INT-07)
     """
 
-    @responses.activate
     def _mock():
         # Initial auth (token will expire)
-        responses.add(
-            responses.POST,
-            FIREBASE_AUTH_URL,
-            json={**FIREBASE_AUTH_SUCCESS, "expiresIn": "0"},  # Expired immediately
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_expiring", 200))
 
         # First API call fails (token expired)
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=FIREBASE_TOKEN_EXPIRED,
-            status=401,
-        )
+        responses.add(_mock_response(responses.POST, START_URL, "token_expired", 401))
 
         # Token refresh succeeds
-        responses.add(
-            responses.POST, FIREBASE_REFRESH_URL, json=FIREBASE_TOKEN_REFRESH_SUCCESS, status=200
-        )
+        responses.add(_mock_response(responses.POST, FIREBASE_REFRESH_URL, "token_refresh", 200))
 
         # Retry succeeds
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, START_URL, "start_success", 200))
 
     return _mock
 
@@ -377,42 +339,21 @@ def mock_state_progression_idle_to_cooking():
     Use for: State transition tests (INT-ST-01, INT-ST-02)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # First status: idle
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
         # Start cook command
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "start"),
-            json=START_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, START_URL, "start_success", 200))
 
         # Second status: preheating
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_PREHEATING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "preheating", 200))
 
         # Third status: cooking (reached temp)
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
     return _mock
 
@@ -429,26 +370,22 @@ def mock_state_progression_cooking_to_done():
     Use for: State transition tests (INT-ST-03)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # First status: cooking with time remaining
         responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING_ALMOST_DONE,
-            status=200,
+            _mock_response(
+                responses.GET,
+                STATUS_URL,
+                "cooking_almost_done",
+                200,
+            )
         )
 
         # Second status: done
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_DONE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "done", 200))
 
     return _mock
 
@@ -466,34 +403,18 @@ def mock_state_progression_cooking_to_idle():
     Use for: State transition tests (INT-ST-05)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # First status: cooking
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
         # Stop cook
-        responses.add(
-            responses.POST,
-            anova_device_url("test-device-123", "stop"),
-            json=STOP_COOK_SUCCESS,
-            status=200,
-        )
+        responses.add(_mock_response(responses.POST, STOP_URL, "stop_success", 200))
 
         # Second status: idle
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_IDLE,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "idle", 200))
 
     return _mock
 
@@ -510,25 +431,14 @@ def mock_connection_lost_during_cook():
     Use for: State transition tests (INT-ST-04)
     """
 
-    @responses.activate
     def _mock():
         # Firebase auth
-        responses.add(responses.POST, FIREBASE_AUTH_URL, json=FIREBASE_AUTH_SUCCESS, status=200)
+        responses.add(_mock_response(responses.POST, FIREBASE_AUTH_URL, "auth_success", 200))
 
         # First status: cooking
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_COOKING,
-            status=200,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "cooking", 200))
 
         # Second status: offline
-        responses.add(
-            responses.GET,
-            anova_device_url("test-device-123", "status"),
-            json=DEVICE_STATUS_OFFLINE_404,
-            status=404,
-        )
+        responses.add(_mock_response(responses.GET, STATUS_URL, "offline_404", 404))
 
     return _mock
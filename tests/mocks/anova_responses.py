@@ -39,170 +39,184 @@ def anova_device_url(device_id: str, endpoint: str = "status") -> str:
 
 
 # ==============================================================================
-# FIREBASE AUTHENTICATION RESPONSES
+# RESPONSE PAYLOADS
 # ==============================================================================
 
-FIREBASE_AUTH_SUCCESS = {
-    "idToken": "mock-id-token-abc123",
-    "refreshToken": "mock-refresh-token-xyz789",
-    "expiresIn": "3600",
-    "localId": "mock-user-id",
-    "email": "test@example.com",
+# Payload dicts are built on first attribute access (PEP 562) and then cached
+# as ordinary module globals, so importing a subset only builds that subset.
+_BUILDERS = {
+    # Firebase authentication responses
+    "FIREBASE_AUTH_SUCCESS": lambda: {
+        "idToken": "mock-id-token-abc123",
+        "refreshToken": "mock-refresh-token-xyz789",
+        "expiresIn": "3600",
+        "localId": "mock-user-id",
+        "email": "test@example.com",
+    },
+    "FIREBASE_AUTH_INVALID_CREDENTIALS": lambda: {
+        "error": {
+            "code": 400,
+            "message": "INVALID_PASSWORD",
+            "errors": [{"message": "INVALID_PASSWORD", "domain": "global", "reason": "invalid"}],
+        }
+    },
+    "FIREBASE_TOKEN_REFRESH_SUCCESS": lambda: {
+        "id_token": "mock-new-id-token-def456",
+        "refresh_token": "mock-refresh-token-xyz789",
+        "expires_in": "3600",
+        "token_type": "Bearer",
+        "user_id": "mock-user-id",
+    },
+    "FIREBASE_TOKEN_EXPIRED": lambda: {"error": {"code": 401, "message": "TOKEN_EXPIRED"}},
+    # Device status responses
+    "DEVICE_STATUS_IDLE": lambda: {
+        "online": True,
+        "state": "idle",
+        "current_temperature": 22.5,
+        "target_temperature": None,
+        "timer_remaining": None,
+        "timer_elapsed": None,
+        "device_id": "test-device-123",
+        "firmware_version": "1.2.3",
+    },
+    "DEVICE_STATUS_PREHEATING": lambda: {
+        "online": True,
+        "state": "preheating",
+        "current_temperature": 45.0,
+        "target_temperature": 65.0,
+        "timer_remaining": None,
+        "timer_elapsed": None,
+        "device_id": "test-device-123",
+        "firmware_version": "1.2.3",
+    },
+    "DEVICE_STATUS_COOKING": lambda: {
+        "online": True,
+        "state": "cooking",
+        "current_temperature": 65.0,
+        "target_temperature": 65.0,
+        "timer_remaining": 45,
+        "timer_elapsed": 45,
+        "device_id": "test-device-123",
+        "firmware_version": "1.2.3",
+    },
+    "DEVICE_STATUS_COOKING_ALMOST_DONE": lambda: {
+        "online": True,
+        "state": "cooking",
+        "current_temperature": 65.0,
+        "target_temperature": 65.0,
+        "timer_remaining": 5,
+        "timer_elapsed": 85,
+        "device_id": "test-device-123",
+        "firmware_version": "1.2.3",
+    },
+    "DEVICE_STATUS_DONE": lambda: {
+        "online": True,
+        "state": "done",
+        "current_temperature": 65.0,
+        "target_temperature": 65.0,
+        "timer_remaining": 0,
+        "timer_elapsed": 90,
+        "device_id": "test-device-123",
+        "firmware_version": "1.2.3",
+    },
+    "DEVICE_STATUS_OFFLINE_404": lambda: {
+        "error": "Device not found or offline",
+        "code": "DEVICE_NOT_FOUND",
+    },
+    "DEVICE_STATUS_OFFLINE_FALSE": lambda: {
+        "online": False,
+        "state": "unknown",
+        "device_id": "test-device-123",
+    },
+    # Device command responses
+    "START_COOK_SUCCESS": lambda: {
+        "success": True,
+        "state": "preheating",
+        "cook_id": "cook-abc123",
+        "device_id": "test-device-123",
+        "target_temperature": 65.0,
+        "timer_duration": 90,
+        "message": "Cook started successfully",
+    },
+    "START_COOK_ALREADY_COOKING": lambda: {
+        "error": "Device already cooking",
+        "code": "DEVICE_BUSY",
+        "current_cook": {"cook_id": "cook-xyz789", "target_temp": 65.0, "time_remaining": 45},
+    },
+    "START_COOK_DEVICE_OFFLINE": lambda: {
+        "error": "Device is offline",
+        "code": "DEVICE_OFFLINE",
+        "message": "Please check device WiFi connection",
+    },
+    "STOP_COOK_SUCCESS": lambda: {
+        "success": True,
+        "state": "idle",
+        "device_id": "test-device-123",
+        "final_temperature": 65.0,
+        "total_time_elapsed": 85,
+        "message": "Cook stopped successfully",
+    },
+    "STOP_COOK_NOT_COOKING": lambda: {
+        "error": "No active cook session",
+        "code": "NO_ACTIVE_COOK",
+        "current_state": "idle",
+    },
+    # Error responses
+    "ERROR_UNAUTHORIZED": lambda: {
+        "error": "Unauthorized",
+        "code": "UNAUTHORIZED",
+        "message": "Invalid or expired authentication token",
+    },
+    "ERROR_RATE_LIMITED": lambda: {
+        "error": "Rate limit exceeded",
+        "code": "RATE_LIMITED",
+        "message": "Too many requests. Please wait before trying again.",
+        "retry_after": 60,
+    },
+    "ERROR_INTERNAL_SERVER": lambda: {
+        "error": "Internal server error",
+        "code": "INTERNAL_ERROR",
+        "message": "An unexpected error occurred. Please try again later.",
+    },
 }
 
-FIREBASE_AUTH_INVALID_CREDENTIALS = {
-    "error": {
-        "code": 400,
-        "message": "INVALID_PASSWORD",
-        "errors": [{"message": "INVALID_PASSWORD", "domain": "global", "reason": "invalid"}],
-    }
-}
 
-FIREBASE_TOKEN_REFRESH_SUCCESS = {
-    "id_token": "mock-new-id-token-def456",
-    "refresh_token": "mock-refresh-token-xyz789",
-    "expires_in": "3600",
-    "token_type": "Bearer",
-    "user_id": "mock-user-id",
-}
+def __getattr__(name: str) -> dict:
+    """Build a payload on first access and cache it as a module global."""
+    try:
+        builder = _BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = builder()
+    globals()[name] = value
+    return value
+
 
-FIREBASE_TOKEN_EXPIRED = {"error": {"code": 401, "message": "TOKEN_EXPIRED"}}
+def __dir__() -> list[str]:
+    """Include not-yet-built payloads so dir() and completion still list them."""
+    return sorted([*globals(), *_BUILDERS])
 
 
 # ==============================================================================
-# DEVICE STATUS RESPONSES
+# CONVENIENCE FUNCTIONS
 # ==============================================================================
 
-DEVICE_STATUS_IDLE = {
-    "online": True,
-    "state": "idle",
-    "current_temperature": 22.5,
-    "target_temperature": None,
-    "timer_remaining": None,
-    "timer_elapsed": None,
-    "device_id": "test-device-123",
-    "firmware_version": "1.2.3",
-}
-
-DEVICE_STATUS_PREHEATING = {
-    "online": True,
-    "state": "preheating",
-    "current_temperature": 45.0,
-    "target_temperature": 65.0,
-    "timer_remaining": None,
-    "timer_elapsed": None,
-    "device_id": "test-device-123",
-    "firmware_version": "1.2.3",
-}
-
-DEVICE_STATUS_COOKING = {
-    "online": True,
-    "state": "cooking",
-    "current_temperature": 65.0,
-    "target_temperature": 65.0,
-    "timer_remaining": 45,
-    "timer_elapsed": 45,
-    "device_id": "test-device-123",
-    "firmware_version": "1.2.3",
-}
-
-DEVICE_STATUS_COOKING_ALMOST_DONE = {
-    "online": True,
-    "state": "cooking",
-    "current_temperature": 65.0,
-    "target_temperature": 65.0,
-    "timer_remaining": 5,
-    "timer_elapsed": 85,
-    "device_id": "test-device-123",
-    "firmware_version": "1.2.3",
-}
 
-DEVICE_STATUS_DONE = {
+# Fixed fields shared by every generated response; helpers merge in the rest
+_DEVICE_STATUS_TEMPLATE = {
     "online": True,
-    "state": "done",
-    "current_temperature": 65.0,
-    "target_temperature": 65.0,
-    "timer_remaining": 0,
-    "timer_elapsed": 90,
     "device_id": "test-device-123",
     "firmware_version": "1.2.3",
 }
 
-DEVICE_STATUS_OFFLINE_404 = {"error": "Device not found or offline", "code": "DEVICE_NOT_FOUND"}
-
-DEVICE_STATUS_OFFLINE_FALSE = {"online": False, "state": "unknown", "device_id": "test-device-123"}
-
-
-# ==============================================================================
-# DEVICE COMMAND RESPONSES
-# ==============================================================================
-
-START_COOK_SUCCESS = {
+_START_COOK_TEMPLATE = {
     "success": True,
     "state": "preheating",
     "cook_id": "cook-abc123",
     "device_id": "test-device-123",
-    "target_temperature": 65.0,
-    "timer_duration": 90,
     "message": "Cook started successfully",
 }
 
-START_COOK_ALREADY_COOKING = {
-    "error": "Device already cooking",
-    "code": "DEVICE_BUSY",
-    "current_cook": {"cook_id": "cook-xyz789", "target_temp": 65.0, "time_remaining": 45},
-}
-
-START_COOK_DEVICE_OFFLINE = {
-    "error": "Device is offline",
-    "code": "DEVICE_OFFLINE",
-    "message": "Please check device WiFi connection",
-}
-
-STOP_COOK_SUCCESS = {
-    "success": True,
-    "state": "idle",
-    "device_id": "test-device-123",
-    "final_temperature": 65.0,
-    "total_time_elapsed": 85,
-    "message": "Cook stopped successfully",
-}
-
-STOP_COOK_NOT_COOKING = {
-    "error": "No active cook session",
-    "code": "NO_ACTIVE_COOK",
-    "current_state": "idle",
-}
-
-
-# ==============================================================================
-# ERROR RESPONSES
-# ==============================================================================
-
-ERROR_UNAUTHORIZED = {
-    "error": "Unauthorized",
-    "code": "UNAUTHORIZED",
-    "message": "Invalid or expired authentication token",
-}
-
-ERROR_RATE_LIMITED = {
-    "error": "Rate limit exceeded",
-    "code": "RATE_LIMITED",
-    "message": "Too many requests. Please wait before trying again.",
-    "retry_after": 60,
-}
-
-ERROR_INTERNAL_SERVER = {
-    "error": "Internal server error",
-    "code": "INTERNAL_ERROR",
-    "message": "An unexpected error occurred. Please try again later.",
-}
-
-
-# ==============================================================================
-# CONVENIENCE FUNCTIONS
-# ==============================================================================
-
 
 def get_device_status_at_temp(
     current_temp: float, target_temp: float, state: str = "preheating"
@@ -218,15 +232,14 @@ def get_device_status_at_temp(
     Returns:
         Device status dict
     """
+    timer = 45 if state == "cooking" else None
     return {
-        "online": True,
+        **_DEVICE_STATUS_TEMPLATE,
         "state": state,
         "current_temperature": current_temp,
         "target_temperature": target_temp,
-        "timer_remaining": 45 if state == "cooking" else None,
-        "timer_elapsed": 45 if state == "cooking" else None,
-        "device_id": "test-device-123",
-        "firmware_version": "1.2.3",
+        "timer_remaining": timer,
+        "timer_elapsed": timer,
     }
 
 
@@ -242,11 +255,7 @@ def get_start_cook_response(target_temp: float, time_minutes: int) -> dict:
         Start cook success response
     """
     return {
-        "success": True,
-        "state": "preheating",
-        "cook_id": "cook-abc123",
-        "device_id": "test-device-123",
+        **_START_COOK_TEMPLATE,
         "target_temperature": target_temp,
         "timer_duration": time_minutes,
-        "message": "Cook started successfully",
     }
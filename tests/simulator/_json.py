@@ -0,0 +1,40 @@
+"""
+JSON helpers for simulator tests.
+
+Uses orjson when installed (much faster encode/decode of WebSocket frames
+and HTTP bodies) and falls back to the standard library otherwise.
+
+Usage:
+    from tests.simulator._json import dumps, loads
+
+    await ws.send(dumps(command))
+    message = loads(await ws.recv())
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON str (ws.send() sends str as a text frame)."""
+        return orjson.dumps(obj).decode()
+
+    def loads(data: str | bytes):
+        """Deserialize a JSON str or bytes."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON str (ws.send() sends str as a text frame)."""
+        return json.dumps(obj)
+
+    def loads(data: str | bytes):
+        """Deserialize a JSON str or bytes."""
+        return json.loads(data)
@@ -0,0 +1,37 @@
+"""
+WebSocket client helper for simulator tests.
+
+Wraps websockets.connect() with options suited to talking to a local
+simulator:
+- permessage-deflate is disabled, since zlib-compressing sub-KB JSON
+  frames over loopback costs more than it saves
+- keepalive pings are disabled; test connections are short-lived and local, so
+  the background ping task is never useful
+- max_size is 64 KiB, well above any simulator frame
+- the receive queue is unbounded; at high time_scale, broadcasts a test never
+  reads would otherwise stall the closing handshake until close_timeout
+
+Usage:
+    from tests.simulator._ws import connect
+
+    async with connect(ws_url) as ws:
+        message = await ws.recv()
+
+    ws = await connect(ws_url)
+"""
+
+import websockets
+
+
+def connect(uri: str, **kwargs) -> websockets.connect:
+    """
+    Open a WebSocket client connection to the simulator.
+
+    Returns the websockets.connect object, so it can be awaited or used as
+    an async context manager. Keyword arguments override the defaults.
+    """
+    kwargs.setdefault("compression", None)
+    kwargs.setdefault("ping_interval", None)
+    kwargs.setdefault("max_size", 2**16)
+    kwargs.setdefault("max_queue", None)
+    return websockets.connect(uri, **kwargs)
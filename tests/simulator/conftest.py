@@ -9,24 +9,64 @@ Provides reusable fixtures for:
 - State fixtures for testing
 
 Usage:
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     async def test_something(simulator, ws_client):
         # simulator is running AnovaSimulator instance
         # ws_client is connected WebSocket
         pass
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import socket
+import warnings
+from collections.abc import AsyncGenerator, Callable
 
+import aiohttp
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.config import Config
 from simulator.control_api import ControlAPI
+from simulator.errors import ErrorSimulator
 from simulator.firebase_mock import FirebaseMock
 from simulator.server import AnovaSimulator
-from simulator.types import CookerState, DeviceState, SimulatorConfig
+from simulator.types import CookerState, DeviceState, generate_request_id
+from tests.simulator._json import dumps
+from tests.simulator._ws import connect
+
+try:
+    # websockets masks every client frame; without its C extension the
+    # XOR runs byte by byte in Python
+    from websockets import speedups  # noqa: F401
+except ImportError:  # pragma: no cover - depends on how websockets was installed
+    warnings.warn(
+        "websockets C speedups are not available; WebSocket frame masking falls "
+        "back to pure Python and simulator tests will run slower",
+        pytest.PytestWarning,
+        stacklevel=1,
+    )
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+# =============================================================================
+# EVENT LOOP
+# =============================================================================
+
+# Run simulator tests on uvloop when it is installed: every ws.send/recv and
+# HTTP request in these tests goes through the loop, and libuv's per-callback
+# overhead is much lower than the selector loop's. The hook is only defined
+# when pytest-asyncio provides it, since pytest rejects unknown pytest_* hooks.
+if uvloop is not None and hasattr(
+    pytest_asyncio.plugin.PytestAsyncioSpecs, "pytest_asyncio_loop_factories"
+):
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Create every simulator test event loop with uvloop."""
+        return {"uvloop": uvloop.new_event_loop}
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -47,7 +87,7 @@ async def consume_initial_messages(ws):
         ws: WebSocket connection
 
     Usage:
-        async with websockets.connect(url) as ws:
+        async with connect(url) as ws:
             await consume_initial_messages(ws)
             # Now ready to send commands
     """
@@ -55,6 +95,28 @@ async def consume_initial_messages(ws):
     await ws.recv()  # Initial state
 
 
+async def wait_until(
+    predicate: Callable[[], bool], timeout: float = 1.0, interval: float = 0.005
+) -> None:
+    """
+    Wait until predicate() is true, polling every interval seconds.
+
+    For conditions outside the device state (connection bookkeeping, error
+    timers); device state changes are better awaited with sim.wait_until().
+
+    Args:
+        predicate: Zero-argument condition
+        timeout: Seconds before giving up
+        interval: Seconds between checks
+
+    Raises:
+        TimeoutError: If the predicate is still false after timeout
+    """
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(interval)
+
+
 # =============================================================================
 # PORT MANAGEMENT
 # =============================================================================
@@ -63,17 +125,27 @@ async def consume_initial_messages(ws):
 class PortManager:
     """Manages port allocation for test isolation."""
 
-    _base_port = 19000
-    _port_offset = 0
-
-    @classmethod
-    def get_ports(cls) -> tuple:
-        """Get unique ports for WS, control, and firebase."""
-        ws_port = cls._base_port + cls._port_offset
-        ctl_port = ws_port + 1
-        fb_port = ws_port + 2
-        cls._port_offset += 10
-        return ws_port, ctl_port, fb_port
+    @staticmethod
+    def get_ports() -> tuple:
+        """
+        Get unique ports for WS, control, and firebase.
+
+        Ports are picked by the OS (bind to port 0), so they avoid ports already
+        in use and the ones other pytest-xdist workers hold. All three sockets
+        stay open until every port is chosen so they are distinct. The sockets
+        are closed before the servers rebind the ports, so another process can
+        still take one in that gap; a collision is unlikely, not impossible.
+        """
+        sockets = []
+        try:
+            for _ in range(3):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.bind(("127.0.0.1", 0))
+                sockets.append(sock)
+            return tuple(sock.getsockname()[1] for sock in sockets)
+        finally:
+            for sock in sockets:
+                sock.close()
 
 
 @pytest.fixture
@@ -82,29 +154,21 @@ def unique_ports() -> tuple:
     return PortManager.get_ports()
 
 
+@pytest.fixture(scope="module")
+def module_ports() -> tuple:
+    """Get unique ports shared by the tests of one module."""
+    return PortManager.get_ports()
+
+
 # =============================================================================
 # CONFIGURATION FIXTURES
 # =============================================================================
 
 
-@pytest.fixture
-def config() -> Config:
-    """Default test configuration."""
-    return Config(
-        ws_port=8765,
-        firebase_port=8764,
-        control_port=8766,
-        time_scale=60.0,  # Accelerated for tests
-        ambient_temp=22.0,
-        heating_rate=1.0,
-        cooker_id="anova test-0000000000",
-    )
-
-
-@pytest.fixture
-def simulator_config(unique_ports) -> Config:
+@pytest.fixture(scope="session")
+def simulator_config() -> Config:
     """Standard configuration for simulator tests with unique ports."""
-    ws_port, ctl_port, fb_port = unique_ports
+    ws_port, ctl_port, fb_port = PortManager.get_ports()
     return Config(
         ws_port=ws_port,
         control_port=ctl_port,
@@ -115,10 +179,10 @@ def simulator_config(unique_ports) -> Config:
     )
 
 
-@pytest.fixture
-def fast_config(unique_ports) -> Config:
+@pytest.fixture(scope="session")
+def fast_config() -> Config:
     """Configuration with accelerated physics for fast tests."""
-    ws_port, ctl_port, fb_port = unique_ports
+    ws_port, ctl_port, fb_port = PortManager.get_ports()
     return Config(
         ws_port=ws_port,
         control_port=ctl_port,
@@ -129,96 +193,144 @@ def fast_config(unique_ports) -> Config:
     )
 
 
-@pytest.fixture
-def legacy_simulator_config() -> SimulatorConfig:
-    """SimulatorConfig for type tests (legacy support)."""
-    return SimulatorConfig(
-        ws_port=8765,
-        time_scale=60.0,
-        cooker_id="anova test-0000000000",
-    )
-
-
 # =============================================================================
 # STATE FIXTURES
 # =============================================================================
 
-
-@pytest.fixture
-def idle_state() -> CookerState:
-    """Cooker in idle state."""
-    return CookerState(
-        cooker_id="anova test-0000000000",
-    )
+# Attribute overrides applied to a fresh CookerState, keyed by state name
+_STATE_SPECS = {
+    "idle": {},
+    "cooking": {
+        "job_status.state": DeviceState.COOKING,
+        "job.target_temperature": 65.0,
+        "job.cook_time_seconds": 5400,
+        "job_status.cook_time_remaining": 2700,
+        "temperature_info.water_temperature": 65.0,
+        "heater_control.duty_cycle": 15.0,
+        "motor_control.duty_cycle": 100.0,
+        "motor_info.rpm": 1200,
+    },
+    "preheating": {
+        "job_status.state": DeviceState.PREHEATING,
+        "job.target_temperature": 65.0,
+        "job.cook_time_seconds": 5400,
+        "job_status.cook_time_remaining": 5400,
+        "temperature_info.water_temperature": 35.0,
+        "heater_control.duty_cycle": 100.0,
+        "motor_control.duty_cycle": 100.0,
+        "motor_info.rpm": 1200,
+    },
+}
 
 
 @pytest.fixture
-def cooking_state() -> CookerState:
-    """Cooker in cooking state."""
-    state = CookerState(
-        cooker_id="anova test-0000000000",
-    )
-    state.job_status.state = DeviceState.COOKING
-    state.job.target_temperature = 65.0
-    state.job.cook_time_seconds = 5400
-    state.job_status.cook_time_remaining = 2700
-    state.temperature_info.water_temperature = 65.0
-    state.heater_control.duty_cycle = 15.0
-    state.motor_control.duty_cycle = 100.0
-    state.motor_info.rpm = 1200
-    return state
+def cooker_state():
+    """
+    Factory for CookerState in a named state ("idle", "cooking", "preheating").
 
+    Example:
+        def test_something(cooker_state):
+            state = cooker_state("cooking")
+            assert state.job_status.state == DeviceState.COOKING
+    """
 
-@pytest.fixture
-def preheating_state() -> CookerState:
-    """Cooker in preheating state."""
-    state = CookerState(
-        cooker_id="anova test-0000000000",
-    )
-    state.job_status.state = DeviceState.PREHEATING
-    state.job.target_temperature = 65.0
-    state.job.cook_time_seconds = 5400
-    state.job_status.cook_time_remaining = 5400
-    state.temperature_info.water_temperature = 35.0
-    state.heater_control.duty_cycle = 100.0
-    state.motor_control.duty_cycle = 100.0
-    state.motor_info.rpm = 1200
-    return state
+    def _make_state(name: str) -> CookerState:
+        state = CookerState(cooker_id="anova test-0000000000")
+        for dotted, value in _STATE_SPECS[name].items():
+            parent, _, attr = dotted.rpartition(".")
+            setattr(getattr(state, parent), attr, value)
+        return state
+
+    return _make_state
 
 
 # =============================================================================
 # SIMULATOR FIXTURES
 # =============================================================================
+#
+# Servers are started once per session per configuration and shared; the
+# function-scoped fixtures below hand them out after reset_stack() has
+# restored a fresh device state. Tests using them must run on the session
+# event loop: pytestmark = pytest.mark.asyncio(loop_scope="session").
+
+
+def reset_stack(
+    sim: AnovaSimulator,
+    control: ControlAPI | None = None,
+    firebase: FirebaseMock | None = None,
+) -> None:
+    """
+    Restore a shared simulator stack to a just-started condition.
 
+    Resets the device state and message history (sim.reset()), and drops
+    active errors and forced token expiry.
 
-@pytest_asyncio.fixture
-async def simulator(simulator_config) -> AsyncGenerator[AnovaSimulator, None]:
+    Args:
+        sim: Running simulator
+        control: Control API sharing the simulator, if any
+        firebase: Firebase mock sharing the simulator, if any
     """
-    Running AnovaSimulator instance.
+    sim.reset()
 
-    Example:
-        async def test_something(simulator):
-            assert simulator.state.job_status.state == DeviceState.IDLE
-    """
+    if control is not None:
+        for task in control.error_simulator._clear_tasks.values():
+            task.cancel()
+        control.error_simulator = ErrorSimulator(simulator=sim)
+    if firebase is not None:
+        firebase.token_manager.force_expiry(False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _simulator_stack(simulator_config) -> AsyncGenerator[tuple, None]:
+    """Session-wide Simulator + Control API + Firebase Mock on simulator_config."""
     sim = AnovaSimulator(config=simulator_config)
     await sim.start()
-    yield sim
+
+    control = ControlAPI(simulator_config, sim)
+    await control.start()
+
+    firebase = FirebaseMock(simulator_config)
+    await firebase.start()
+
+    yield sim, control, firebase
+
+    await firebase.stop()
+    await control.stop()
     await sim.stop()
 
 
-@pytest_asyncio.fixture
-async def fast_simulator(fast_config) -> AsyncGenerator[AnovaSimulator, None]:
-    """Simulator with accelerated physics for fast tests."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _fast_simulator_stack(fast_config) -> AsyncGenerator[AnovaSimulator, None]:
+    """Session-wide simulator on fast_config."""
     sim = AnovaSimulator(config=fast_config)
     await sim.start()
     yield sim
     await sim.stop()
 
 
-@pytest_asyncio.fixture
-async def simulator_with_control(
-    simulator_config,
-) -> AsyncGenerator[tuple, None]:
+@pytest.fixture
+def simulator(_simulator_stack) -> AnovaSimulator:
+    """
+    Running AnovaSimulator instance, reset to IDLE.
+
+    Example:
+        async def test_something(simulator):
+            assert simulator.state.job_status.state == DeviceState.IDLE
+    """
+    sim, control, firebase = _simulator_stack
+    reset_stack(sim, control, firebase)
+    return sim
+
+
+@pytest.fixture
+def fast_simulator(_fast_simulator_stack) -> AnovaSimulator:
+    """Simulator with accelerated physics for fast tests."""
+    reset_stack(_fast_simulator_stack)
+    return _fast_simulator_stack
+
+
+@pytest.fixture
+def simulator_with_control(_simulator_stack) -> tuple:
     """
     Simulator with Control API running.
 
@@ -227,22 +339,13 @@ async def simulator_with_control(
             sim, control = simulator_with_control
             # Use sim.state or control API endpoints
     """
-    sim = AnovaSimulator(config=simulator_config)
-    await sim.start()
-
-    control = ControlAPI(simulator_config, sim)
-    await control.start()
-
-    yield sim, control
-
-    await control.stop()
-    await sim.stop()
+    sim, control, firebase = _simulator_stack
+    reset_stack(sim, control, firebase)
+    return sim, control
 
 
-@pytest_asyncio.fixture
-async def full_simulator(
-    simulator_config,
-) -> AsyncGenerator[tuple, None]:
+@pytest.fixture
+def full_simulator(_simulator_stack) -> tuple:
     """
     Full simulator stack: Simulator + Control API + Firebase Mock.
 
@@ -250,20 +353,8 @@ async def full_simulator(
         async def test_something(full_simulator):
             sim, control, firebase = full_simulator
     """
-    sim = AnovaSimulator(config=simulator_config)
-    await sim.start()
-
-    control = ControlAPI(simulator_config, sim)
-    await control.start()
-
-    firebase = FirebaseMock(simulator_config)
-    await firebase.start()
-
-    yield sim, control, firebase
-
-    await firebase.stop()
-    await control.stop()
-    await sim.stop()
+    reset_stack(*_simulator_stack)
+    return _simulator_stack
 
 
 # =============================================================================
@@ -271,22 +362,37 @@ async def full_simulator(
 # =============================================================================
 
 
-@pytest_asyncio.fixture
-async def ws_client(simulator, simulator_config) -> AsyncGenerator:
+@pytest_asyncio.fixture(loop_scope="session")
+async def ws_client_raw(simulator, ws_url) -> AsyncGenerator:
+    """
+    Connected WebSocket client with the initial messages still unread.
+
+    Example:
+        async def test_something(ws_client_raw):
+            device_list = json.loads(await ws_client_raw.recv())
+            assert device_list["command"] == "EVENT_APC_WIFI_LIST"
+    """
+    ws = await connect(ws_url)
+    yield ws
+    await ws.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def ws_client(ws_client_raw):
     """
     Connected WebSocket client.
 
+    The device list and initial state are drained before the test starts.
+    Both frames are already buffered on connect, so the two reads are
+    sequential (websockets does not allow concurrent recv() calls).
+
     Example:
         async def test_something(ws_client):
             await ws_client.send(json.dumps({"command": "CMD_APC_START", ...}))
             response = await ws_client.recv()
     """
-    url = f"ws://localhost:{simulator_config.ws_port}?token=test-token&supportedAccessories=APC"
-    ws = await websockets.connect(url)
-    await ws.recv()  # Consume device list
-    await ws.recv()  # Consume initial state
-    yield ws
-    await ws.close()
+    await consume_initial_messages(ws_client_raw)
+    return ws_client_raw
 
 
 @pytest.fixture
@@ -306,53 +412,96 @@ def control_url(simulator_config) -> str:
     return f"http://localhost:{simulator_config.control_port}"
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """
+    One aiohttp session shared by the session-scoped simulator stacks.
+
+    Keeps connections to the simulator servers alive between requests and
+    serializes json= bodies with the fast dumps() from _json. Runs on the
+    session event loop, like _simulator_stack.
+    """
+    async with aiohttp.ClientSession(json_serialize=dumps) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_http_session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """
+    http_session for modules that start their own simulator on the module loop.
+
+    Tests using it must run on the module event loop:
+    pytestmark = pytest.mark.asyncio(loop_scope="module").
+    """
+    async with aiohttp.ClientSession(json_serialize=dumps) as session:
+        yield session
+
+
 # =============================================================================
 # HELPER FIXTURES
 # =============================================================================
 
 
 @pytest.fixture
-def start_command():
-    """Factory for CMD_APC_START messages."""
+def firebase_token():
+    """
+    Factory for Firebase tokens issued without the HTTP sign-in round trip.
 
-    def _make_command(
-        temp: float = 65.0,
-        timer: int = 3600,
-        unit: str = "C",
-    ) -> dict:
-        from simulator.types import generate_request_id
+    Tokens are minted directly on the mock's TokenManager, so each call
+    issues a fresh pair.
 
-        request_id = generate_request_id()
-        return {
-            "command": "CMD_APC_START",
-            "requestId": request_id,
-            "payload": {
-                "cookerId": "anova sim-0000000000",
-                "type": "pro",
-                "targetTemperature": temp,
-                "unit": unit,
-                "timer": timer,
-                "requestId": request_id,
-            },
-        }
+    Example:
+        async def test_something(firebase_mock, firebase_token):
+            id_token, refresh_token = firebase_token(firebase_mock)
+    """
 
-    return _make_command
+    def _get_token(
+        firebase: FirebaseMock,
+        email: str = "test@example.com",
+        password: str = "testpassword123",
+    ) -> tuple:
+        id_token, refresh_token, error = firebase.token_manager.authenticate(email, password)
+        assert error is None, f"Test credentials rejected: {error}"
+        return id_token, refresh_token
 
+    return _get_token
 
-@pytest.fixture
-def stop_command():
-    """Factory for CMD_APC_STOP messages."""
 
-    def _make_command() -> dict:
-        from simulator.types import generate_request_id
+@pytest.fixture
+def ws_command():
+    """
+    Factory for command messages: ws_command("start", temp=..., timer=..., unit=...)
+    builds CMD_APC_START and ws_command("stop") builds CMD_APC_STOP.
+    """
 
+    def _make_command(
+        kind: str,
+        temp: float = 65.0,
+        timer: int = 3600,
+        unit: str = "C",
+    ) -> dict:
         request_id = generate_request_id()
-        return {
-            "command": "CMD_APC_STOP",
-            "requestId": request_id,
-            "payload": {
-                "cookerId": "anova sim-0000000000",
-            },
-        }
+        if kind == "start":
+            return {
+                "command": "CMD_APC_START",
+                "requestId": request_id,
+                "payload": {
+                    "cookerId": "anova sim-0000000000",
+                    "type": "pro",
+                    "targetTemperature": temp,
+                    "unit": unit,
+                    "timer": timer,
+                    "requestId": request_id,
+                },
+            }
+        if kind == "stop":
+            return {
+                "command": "CMD_APC_STOP",
+                "requestId": request_id,
+                "payload": {
+                    "cookerId": "anova sim-0000000000",
+                },
+            }
+        raise ValueError(f"Unknown command kind: {kind!r}")
 
     return _make_command
@@ -7,22 +7,17 @@ Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 5
 import asyncio
 import json
 
-import aiohttp
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.auth import TokenManager
 from simulator.config import Config
 from simulator.firebase_mock import FirebaseMock
 from simulator.server import AnovaSimulator
+from tests.simulator._ws import connect
 
-# Note: Only async tests should be marked with @pytest.mark.asyncio
-
-# Unique ports for auth tests
-PORT_FB = 18850
-PORT_WS = 18851
-
+# Note: Only async tests should be marked with @pytest.mark.asyncio.
+# They run on the module event loop, shared with the servers and module_http_session.
 
 # =============================================================================
 # TOKEN MANAGER UNIT TESTS
@@ -106,6 +101,14 @@ class TestTokenManager:
         tm.force_expiry(False)
         assert tm.is_token_valid(id_token)
 
+    def test_token_expires_after_expiry_time(self):
+        """Should treat tokens past their expiry time as invalid."""
+        tm = TokenManager({"test@example.com": "password123"}, token_expiry=-1)
+
+        id_token, _, _ = tm.authenticate("test@example.com", "password123")
+
+        assert not tm.is_token_valid(id_token)
+
 
 # =============================================================================
 # FIREBASE MOCK HTTP TESTS
@@ -113,17 +116,24 @@ class TestTokenManager:
 
 
 @pytest.fixture
-def auth_config():
-    """Configuration for auth tests."""
+def auth_config(request, unique_ports):
+    """
+    Configuration for auth tests.
+
+    Tests can override fields through indirect parametrization:
+        @pytest.mark.parametrize("auth_config", [{"valid_tokens": []}], indirect=True)
+    """
+    ws_port, _, fb_port = unique_ports
+    overrides = getattr(request, "param", {})
     return Config(
-        firebase_port=PORT_FB,
-        ws_port=PORT_WS,
+        firebase_port=fb_port,
+        ws_port=ws_port,
         firebase_credentials={"test@example.com": "testpassword123"},
-        valid_tokens=["test-token"],
+        **{"valid_tokens": ["test-token"], **overrides},
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def firebase_mock(auth_config):
     """Start Firebase mock for tests."""
     mock = FirebaseMock(auth_config)
@@ -132,97 +142,68 @@ async def firebase_mock(auth_config):
     await mock.stop()
 
 
-@pytest.mark.asyncio
-async def test_auth01_token_refresh_valid(firebase_mock, auth_config):
-    """AUTH-01: Token refresh with valid refresh token returns id_token."""
-    async with aiohttp.ClientSession() as session:
-        # First, sign in to get tokens
-        sign_in_url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
-        async with session.post(
-            sign_in_url,
-            json={"email": "test@example.com", "password": "testpassword123"},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            refresh_token = data["refreshToken"]
-
-        # Now refresh the token
-        refresh_url = f"http://localhost:{auth_config.firebase_port}/v1/token"
-        async with session.post(
-            refresh_url,
-            json={"grant_type": "refresh_token", "refresh_token": refresh_token},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            assert "id_token" in data
-            assert "access_token" in data
-            assert "refresh_token" in data
-
-
-@pytest.mark.asyncio
-async def test_auth02_token_refresh_invalid(firebase_mock, auth_config):
-    """AUTH-02: Token refresh with invalid refresh token returns 401."""
-    async with aiohttp.ClientSession() as session:
-        refresh_url = f"http://localhost:{auth_config.firebase_port}/v1/token"
-        async with session.post(
-            refresh_url,
-            json={"grant_type": "refresh_token", "refresh_token": "invalid-token"},
-        ) as resp:
-            assert resp.status == 401
-
-
 @pytest.fixture
-def auth03_config():
-    """Configuration for AUTH-03 test with Firebase-issued tokens."""
-    return Config(
-        firebase_port=PORT_FB + 2,
-        ws_port=PORT_WS + 2,
-        firebase_credentials={"test@example.com": "testpassword123"},
-        valid_tokens=[],  # Empty - we'll use Firebase tokens
-    )
-
-
-@pytest_asyncio.fixture
-async def auth03_firebase(auth03_config):
-    """Start Firebase mock for AUTH-03."""
-    mock = FirebaseMock(auth03_config)
-    await mock.start()
-    yield mock
-    await mock.stop()
+def issued_tokens(firebase_mock, auth_config, firebase_token):
+    """(id_token, refresh_token) per configured user, minted without HTTP sign-in."""
+    return {
+        email: firebase_token(firebase_mock, email, password)
+        for email, password in auth_config.firebase_credentials.items()
+    }
 
 
-@pytest_asyncio.fixture
-async def auth03_simulator(auth03_config, auth03_firebase):
-    """Start simulator for AUTH-03 that validates against Firebase."""
-    sim = AnovaSimulator(config=auth03_config)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auth01_token_refresh_valid(auth_config, issued_tokens, module_http_session):
+    """AUTH-01: Token refresh with valid refresh token returns id_token."""
+    _, refresh_token = issued_tokens["test@example.com"]
+
+    # Refresh the token
+    refresh_url = f"http://localhost:{auth_config.firebase_port}/v1/token"
+    async with module_http_session.post(
+        refresh_url,
+        json={"grant_type": "refresh_token", "refresh_token": refresh_token},
+    ) as resp:
+        assert resp.status == 200
+        data = await resp.json()
+        assert "id_token" in data
+        assert "access_token" in data
+        assert "refresh_token" in data
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auth02_token_refresh_invalid(firebase_mock, auth_config, module_http_session):
+    """AUTH-02: Token refresh with invalid refresh token returns 401."""
+    refresh_url = f"http://localhost:{auth_config.firebase_port}/v1/token"
+    async with module_http_session.post(
+        refresh_url,
+        json={"grant_type": "refresh_token", "refresh_token": "invalid-token"},
+    ) as resp:
+        assert resp.status == 401
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def auth_simulator(auth_config, firebase_mock):
+    """Start simulator that validates WebSocket tokens against the Firebase mock."""
+    sim = AnovaSimulator(config=auth_config)
     # Share the token manager between Firebase mock and WebSocket server
-    sim.ws_server._validate_token = lambda t: auth03_firebase.token_manager.is_token_valid(t)
+    sim.ws_server._validate_token = lambda t: firebase_mock.token_manager.is_token_valid(t)
     await sim.start()
-    yield sim, auth03_firebase
+    yield sim
     await sim.stop()
 
 
-@pytest.mark.asyncio
-async def test_auth03_websocket_with_firebase_token(auth03_simulator, auth03_config):
+# Empty valid_tokens - only Firebase-issued tokens are accepted
+@pytest.mark.parametrize("auth_config", [{"valid_tokens": []}], indirect=True)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auth03_websocket_with_firebase_token(
+    auth_simulator, firebase_mock, auth_config, firebase_token
+):
     """AUTH-03: WebSocket connection with Firebase-issued token should be accepted."""
-    sim, firebase = auth03_simulator
-
-    async with aiohttp.ClientSession() as session:
-        # Get token from Firebase
-        sign_in_url = (
-            f"http://localhost:{auth03_config.firebase_port}/v1/accounts:signInWithPassword"
-        )
-        async with session.post(
-            sign_in_url,
-            json={"email": "test@example.com", "password": "testpassword123"},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            token = data["idToken"]
+    # Get token from Firebase (sign-in over HTTP is covered by the sign-in tests)
+    token, _ = firebase_token(firebase_mock)
 
     # Connect to WebSocket with Firebase token
-    url = f"ws://localhost:{auth03_config.ws_port}?token={token}&supportedAccessories=APC"
-    async with websockets.connect(url) as ws:
+    url = f"ws://localhost:{auth_config.ws_port}?token={token}&supportedAccessories=APC"
+    async with connect(url) as ws:
         # First message: device list
         msg1 = await asyncio.wait_for(ws.recv(), timeout=2.0)
         data1 = json.loads(msg1)
@@ -234,51 +215,21 @@ async def test_auth03_websocket_with_firebase_token(auth03_simulator, auth03_con
         assert data["command"] == "EVENT_APC_STATE"
 
 
-@pytest.fixture
-def auth04_config():
-    """Configuration for AUTH-04 test with short token expiry."""
-    return Config(
-        firebase_port=PORT_FB + 4,
-        ws_port=PORT_WS + 4,
-        firebase_credentials={"test@example.com": "testpassword123"},
-        token_expiry=1,  # 1 second expiry for testing
-        valid_tokens=[],
-    )
-
-
-@pytest_asyncio.fixture
-async def auth04_firebase(auth04_config):
-    """Start Firebase mock for AUTH-04."""
-    mock = FirebaseMock(auth04_config)
-    await mock.start()
-    yield mock
-    await mock.stop()
-
-
-@pytest.mark.asyncio
-async def test_auth04_token_expiry_simulation(auth04_firebase, auth04_config):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auth04_token_expiry_simulation(firebase_mock, issued_tokens):
     """AUTH-04: Token expiry simulation works correctly."""
-    # Get token from Firebase
-    async with aiohttp.ClientSession() as session:
-        sign_in_url = (
-            f"http://localhost:{auth04_config.firebase_port}/v1/accounts:signInWithPassword"
-        )
-        async with session.post(
-            sign_in_url,
-            json={"email": "test@example.com", "password": "testpassword123"},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            token = data["idToken"]
+    token, _ = issued_tokens["test@example.com"]
+    token_manager = firebase_mock.token_manager
 
     # Token should be valid immediately
-    assert auth04_firebase.token_manager.is_token_valid(token)
+    assert token_manager.is_token_valid(token)
 
-    # Wait for token to expire (1 second + buffer)
-    await asyncio.sleep(1.5)
+    # Forced expiry invalidates it without waiting out token_expiry
+    token_manager.force_expiry(True)
+    assert not token_manager.is_token_valid(token)
 
-    # Token should now be expired
-    assert not auth04_firebase.token_manager.is_token_valid(token)
+    token_manager.force_expiry(False)
+    assert token_manager.is_token_valid(token)
 
 
 # =============================================================================
@@ -286,42 +237,39 @@ async def test_auth04_token_expiry_simulation(auth04_firebase, auth04_config):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_sign_in_valid_credentials(firebase_mock, auth_config):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_sign_in_valid_credentials(firebase_mock, auth_config, module_http_session):
     """Sign in with valid credentials returns tokens."""
-    async with aiohttp.ClientSession() as session:
-        url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
-        async with session.post(
-            url,
-            json={"email": "test@example.com", "password": "testpassword123"},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            assert "idToken" in data
-            assert "refreshToken" in data
-            assert data["email"] == "test@example.com"
-            assert data["registered"] is True
-
-
-@pytest.mark.asyncio
-async def test_sign_in_invalid_password(firebase_mock, auth_config):
+    url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
+    async with module_http_session.post(
+        url,
+        json={"email": "test@example.com", "password": "testpassword123"},
+    ) as resp:
+        assert resp.status == 200
+        data = await resp.json()
+        assert "idToken" in data
+        assert "refreshToken" in data
+        assert data["email"] == "test@example.com"
+        assert data["registered"] is True
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_sign_in_invalid_password(firebase_mock, auth_config, module_http_session):
     """Sign in with invalid password returns 401."""
-    async with aiohttp.ClientSession() as session:
-        url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
-        async with session.post(
-            url,
-            json={"email": "test@example.com", "password": "wrongpassword"},
-        ) as resp:
-            assert resp.status == 401
+    url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
+    async with module_http_session.post(
+        url,
+        json={"email": "test@example.com", "password": "wrongpassword"},
+    ) as resp:
+        assert resp.status == 401
 
 
-@pytest.mark.asyncio
-async def test_sign_in_unknown_email(firebase_mock, auth_config):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_sign_in_unknown_email(firebase_mock, auth_config, module_http_session):
     """Sign in with unknown email returns 401."""
-    async with aiohttp.ClientSession() as session:
-        url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
-        async with session.post(
-            url,
-            json={"email": "unknown@example.com", "password": "password123"},
-        ) as resp:
-            assert resp.status == 401
+    url = f"http://localhost:{auth_config.firebase_port}/v1/accounts:signInWithPassword"
+    async with module_http_session.post(
+        url,
+        json={"email": "unknown@example.com", "password": "password123"},
+    ) as resp:
+        assert resp.status == 401
@@ -15,291 +15,279 @@ Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 2
 """
 
 import asyncio
-import json
+import functools
+import itertools
+from typing import NamedTuple
 
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.config import Config
 from simulator.server import AnovaSimulator
-from simulator.types import generate_request_id
+from tests.simulator._json import dumps, loads
+from tests.simulator._ws import connect
 
-pytestmark = pytest.mark.asyncio(loop_scope="function")
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     """Test configuration."""
+    # Command tests never wait on simulated time, so run in real time: the
+    # physics tick and broadcast loops sleep for interval / time_scale.
     return Config(
-        ws_port=18766,  # Different port to avoid conflicts
-        time_scale=60.0,
+        ws_port=0,  # Picked by the OS when the simulator starts
+        time_scale=1.0,
         valid_tokens=["valid-test-token"],
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def simulator(config):
-    """Start simulator for tests."""
+    """Start simulator once for the module."""
     sim = AnovaSimulator(config=config)
     await sim.start()
     yield sim
     await sim.stop()
 
 
-@pytest.fixture
-def ws_url(config):
+@pytest.fixture(autouse=True)
+def _reset(simulator):
+    """Return the shared simulator to IDLE before each test."""
+    simulator.reset()
+
+
+@pytest.fixture(scope="module")
+def ws_url(simulator):
     """WebSocket URL."""
-    return f"ws://localhost:{config.ws_port}?token=valid-test-token&supportedAccessories=APC"
+    return f"ws://localhost:{simulator.ws_port}?token=valid-test-token&supportedAccessories=APC"
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="module")
+async def ws(simulator, ws_url):
+    """WebSocket connection shared by the tests of one class."""
+    async with connect(ws_url) as conn:
+        await conn.recv()  # Device list
+        await conn.recv()  # Initial state
+        yield conn
+
+
+class Command(NamedTuple):
+    """A serialized command frame and the requestId it carries."""
+
+    request_id: str
+    frame: str
+
+
+async def send_command(ws, cmd: Command) -> dict:
+    """
+    Send a command and return its RESPONSE.
+
+    State broadcasts queued on the shared connection before the response
+    (periodic updates, or leftovers from the previous test) are skipped, so
+    the next frame after the response reflects the command's effect. Only the
+    response carries the unique requestId, so skipped frames are never decoded.
+    """
+    await ws.send(cmd.frame)
+    while True:
+        frame = await asyncio.wait_for(ws.recv(), timeout=5.0)
+        if cmd.request_id in frame:
+            return loads(frame)
+
+
+# Command frames are encoded once per distinct set of parameters with a
+# placeholder requestId; each build_*() call only splices in a fresh id.
+_REQUEST_ID_PLACEHOLDER = "__request_id__"
+
+
+def _encode(command: str, **fields) -> str:
+    """Encode a command frame carrying the requestId placeholder."""
+    return dumps(
+        {
+            "command": command,
+            "requestId": _REQUEST_ID_PLACEHOLDER,
+            "payload": {
+                "cookerId": "anova sim-0000000000",
+                "type": "pro",
+                **fields,
+                "requestId": _REQUEST_ID_PLACEHOLDER,
+            },
+        }
+    )
 
 
-def build_start_command(temp: float = 65.0, timer: int = 5400, unit: str = "C"):
-    """Build CMD_APC_START message."""
-    request_id = generate_request_id()
-    return {
-        "command": "CMD_APC_START",
-        "requestId": request_id,
-        "payload": {
-            "cookerId": "anova sim-0000000000",
-            "type": "pro",
-            "targetTemperature": temp,
-            "unit": unit,
-            "timer": timer,
-            "requestId": request_id,
-        },
-    }
-
-
-def build_stop_command():
-    """Build CMD_APC_STOP message."""
-    request_id = generate_request_id()
-    return {
-        "command": "CMD_APC_STOP",
-        "requestId": request_id,
-        "payload": {
-            "cookerId": "anova sim-0000000000",
-            "type": "pro",
-            "requestId": request_id,
-        },
-    }
-
-
-def build_set_temp_command(temp: float, unit: str = "C"):
-    """Build CMD_APC_SET_TARGET_TEMP message."""
-    request_id = generate_request_id()
-    return {
-        "command": "CMD_APC_SET_TARGET_TEMP",
-        "requestId": request_id,
-        "payload": {
-            "cookerId": "anova sim-0000000000",
-            "type": "pro",
-            "targetTemperature": temp,
-            "unit": unit,
-            "requestId": request_id,
-        },
-    }
-
-
-def build_set_timer_command(timer: int):
-    """Build CMD_APC_SET_TIMER message."""
-    request_id = generate_request_id()
-    return {
-        "command": "CMD_APC_SET_TIMER",
-        "requestId": request_id,
-        "payload": {
-            "cookerId": "anova sim-0000000000",
-            "type": "pro",
-            "timer": timer,
-            "requestId": request_id,
-        },
-    }
+# Request IDs only need to be unique within a run; a counter formatted like
+# generate_request_id() (22 hex digits) avoids a secrets call per command.
+_next_request_number = itertools.count(1).__next__
 
 
-class TestStartCommand:
-    """Test CMD_APC_START command."""
+def _with_request_id(template: str) -> Command:
+    """Fill a pre-encoded frame with a new requestId."""
+    request_id = f"{_next_request_number():022x}"
+    return Command(request_id, template.replace(_REQUEST_ID_PLACEHOLDER, request_id))
 
-    @pytest.mark.asyncio
-    async def test_cmd01_start_valid_params(self, simulator, ws_url):
-        """CMD-01: START with valid params should succeed."""
-        async with websockets.connect(ws_url) as ws:
-            # Consume initial messages
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
 
-            # Send START command
-            cmd = build_start_command(temp=65.0, timer=5400)
-            await ws.send(json.dumps(cmd))
+_STOP_TEMPLATE = _encode("CMD_APC_STOP")
 
-            # Should receive success response
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
 
-            assert response["command"] == "RESPONSE"
-            assert response["requestId"] == cmd["requestId"]
-            assert response["payload"]["status"] == "ok"
+@functools.lru_cache(maxsize=64)
+def _encode_start(temp: float, timer: int, unit: str) -> str:
+    return _encode("CMD_APC_START", targetTemperature=temp, unit=unit, timer=timer)
 
-            # Should also receive state update
-            state_msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
-            assert state_msg["command"] == "EVENT_APC_STATE"
-            assert state_msg["payload"]["state"]["job-status"]["state"] == "PREHEATING"
 
-    @pytest.mark.asyncio
-    async def test_cmd02_start_temp_too_low(self, simulator, ws_url):
-        """CMD-02: START with temp < 40°C should fail."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+@functools.lru_cache(maxsize=64)
+def _encode_set_temp(temp: float, unit: str) -> str:
+    return _encode("CMD_APC_SET_TARGET_TEMP", targetTemperature=temp, unit=unit)
 
-            cmd = build_start_command(temp=35.0)
-            await ws.send(json.dumps(cmd))
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+@functools.lru_cache(maxsize=64)
+def _encode_set_timer(timer: int) -> str:
+    return _encode("CMD_APC_SET_TIMER", timer=timer)
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "error"
-            assert response["payload"]["code"] == "INVALID_TEMPERATURE"
 
-    @pytest.mark.asyncio
-    async def test_cmd03_start_temp_too_high(self, simulator, ws_url):
-        """CMD-03: START with temp > 100°C should fail."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+def build_start_command(temp: float = 65.0, timer: int = 5400, unit: str = "C") -> Command:
+    """Build CMD_APC_START message."""
+    return _with_request_id(_encode_start(temp, timer, unit))
 
-            cmd = build_start_command(temp=105.0)
-            await ws.send(json.dumps(cmd))
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+def build_stop_command() -> Command:
+    """Build CMD_APC_STOP message."""
+    return _with_request_id(_STOP_TEMPLATE)
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "error"
-            assert response["payload"]["code"] == "INVALID_TEMPERATURE"
 
-    @pytest.mark.asyncio
-    async def test_cmd04_start_when_cooking(self, simulator, ws_url):
-        """CMD-04: START when already cooking should fail with DEVICE_BUSY."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+def build_set_temp_command(temp: float, unit: str = "C") -> Command:
+    """Build CMD_APC_SET_TARGET_TEMP message."""
+    return _with_request_id(_encode_set_temp(temp, unit))
 
-            # Start first cook
-            cmd1 = build_start_command(temp=65.0, timer=5400)
-            await ws.send(json.dumps(cmd1))
-            await ws.recv()  # Response
-            await ws.recv()  # State update
 
-            # Try to start second cook
-            cmd2 = build_start_command(temp=70.0, timer=3600)
-            await ws.send(json.dumps(cmd2))
+def build_set_timer_command(timer: int) -> Command:
+    """Build CMD_APC_SET_TIMER message."""
+    return _with_request_id(_encode_set_timer(timer))
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "error"
-            assert response["payload"]["code"] == "DEVICE_BUSY"
+class TestStartCommand:
+    """Test CMD_APC_START command."""
 
+    async def test_cmd01_start_valid_params(self, ws):
+        """CMD-01: START with valid params should succeed."""
+        # Send START command
+        cmd = build_start_command(temp=65.0, timer=5400)
+
+        # Should receive success response
+        response = await send_command(ws, cmd)
+
+        assert response["command"] == "RESPONSE"
+        assert response["requestId"] == cmd.request_id
+        assert response["payload"]["status"] == "ok"
+
+        # Should also receive state update
+        state_msg = loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+        assert state_msg["command"] == "EVENT_APC_STATE"
+        assert state_msg["payload"]["state"]["job-status"]["state"] == "PREHEATING"
+
+    @pytest.mark.parametrize(
+        "temp",
+        [
+            pytest.param(35.0, id="cmd02_temp_too_low"),
+            pytest.param(105.0, id="cmd03_temp_too_high"),
+        ],
+    )
+    async def test_start_temp_out_of_range(self, ws, temp):
+        """CMD-02/03: START with temp < 40°C or > 100°C should fail."""
+        cmd = build_start_command(temp=temp)
+        response = await send_command(ws, cmd)
 
-class TestStopCommand:
-    """Test CMD_APC_STOP command."""
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "error"
+        assert response["payload"]["code"] == "INVALID_TEMPERATURE"
 
-    @pytest.mark.asyncio
-    async def test_cmd05_stop_when_cooking(self, simulator, ws_url):
-        """CMD-05: STOP when cooking should succeed."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+    async def test_cmd04_start_when_cooking(self, ws):
+        """CMD-04: START when already cooking should fail with DEVICE_BUSY."""
+        # Start first cook
+        cmd1 = build_start_command(temp=65.0, timer=5400)
+        await send_command(ws, cmd1)
+        await ws.recv()  # State update
 
-            # Start cook
-            start_cmd = build_start_command()
-            await ws.send(json.dumps(start_cmd))
-            await ws.recv()  # Response
-            await ws.recv()  # State update
+        # Try to start second cook
+        cmd2 = build_start_command(temp=70.0, timer=3600)
+        response = await send_command(ws, cmd2)
 
-            # Stop cook
-            stop_cmd = build_stop_command()
-            await ws.send(json.dumps(stop_cmd))
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "error"
+        assert response["payload"]["code"] == "DEVICE_BUSY"
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "ok"
+class TestStopCommand:
+    """Test CMD_APC_STOP command."""
+
+    async def test_cmd05_stop_when_cooking(self, ws):
+        """CMD-05: STOP when cooking should succeed."""
+        # Start cook
+        start_cmd = build_start_command()
+        await send_command(ws, start_cmd)
+        await ws.recv()  # State update
 
-            # Should also receive state update showing IDLE
-            state_msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
-            assert state_msg["payload"]["state"]["job-status"]["state"] == "IDLE"
+        # Stop cook
+        stop_cmd = build_stop_command()
+        response = await send_command(ws, stop_cmd)
 
-    @pytest.mark.asyncio
-    async def test_cmd06_stop_when_idle(self, simulator, ws_url):
-        """CMD-06: STOP when idle should fail with NO_ACTIVE_COOK."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "ok"
 
-            # Try to stop without active cook
-            cmd = build_stop_command()
-            await ws.send(json.dumps(cmd))
+        # Should also receive state update showing IDLE
+        state_msg = loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+        assert state_msg["payload"]["state"]["job-status"]["state"] == "IDLE"
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+    async def test_cmd06_stop_when_idle(self, ws):
+        """CMD-06: STOP when idle should fail with NO_ACTIVE_COOK."""
+        # Try to stop without active cook
+        cmd = build_stop_command()
+        response = await send_command(ws, cmd)
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "error"
-            assert response["payload"]["code"] == "NO_ACTIVE_COOK"
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "error"
+        assert response["payload"]["code"] == "NO_ACTIVE_COOK"
 
 
 class TestSetTempCommand:
     """Test CMD_APC_SET_TARGET_TEMP command."""
 
-    @pytest.mark.asyncio
-    async def test_cmd07_set_temp_valid(self, simulator, ws_url):
+    async def test_cmd07_set_temp_valid(self, ws):
         """CMD-07: SET_TARGET_TEMP with valid temp should succeed."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
+        # Start cook first
+        start_cmd = build_start_command(temp=65.0)
+        await send_command(ws, start_cmd)
+        await ws.recv()  # State update
 
-            # Start cook first
-            start_cmd = build_start_command(temp=65.0)
-            await ws.send(json.dumps(start_cmd))
-            await ws.recv()  # Response
-            await ws.recv()  # State update
+        # Change temperature
+        set_temp_cmd = build_set_temp_command(temp=70.0)
+        response = await send_command(ws, set_temp_cmd)
 
-            # Change temperature
-            set_temp_cmd = build_set_temp_command(temp=70.0)
-            await ws.send(json.dumps(set_temp_cmd))
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "ok"
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
-
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "ok"
-
-            # Verify temp changed in state
-            state_msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
-            assert state_msg["payload"]["state"]["job"]["target-temperature"] == 70.0
+        # Verify temp changed in state
+        state_msg = loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+        assert state_msg["payload"]["state"]["job"]["target-temperature"] == 70.0
 
 
 class TestSetTimerCommand:
     """Test CMD_APC_SET_TIMER command."""
 
-    @pytest.mark.asyncio
-    async def test_cmd08_set_timer_valid(self, simulator, ws_url):
+    async def test_cmd08_set_timer_valid(self, ws):
         """CMD-08: SET_TIMER with valid timer should succeed."""
-        async with websockets.connect(ws_url) as ws:
-            await ws.recv()  # Device list
-            await ws.recv()  # Initial state
-
-            # Start cook first
-            start_cmd = build_start_command(timer=5400)
-            await ws.send(json.dumps(start_cmd))
-            await ws.recv()  # Response
-            await ws.recv()  # State update
-
-            # Change timer
-            set_timer_cmd = build_set_timer_command(timer=7200)
-            await ws.send(json.dumps(set_timer_cmd))
+        # Start cook first
+        start_cmd = build_start_command(timer=5400)
+        await send_command(ws, start_cmd)
+        await ws.recv()  # State update
 
-            response = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+        # Change timer
+        set_timer_cmd = build_set_timer_command(timer=7200)
+        response = await send_command(ws, set_timer_cmd)
 
-            assert response["command"] == "RESPONSE"
-            assert response["payload"]["status"] == "ok"
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "ok"
 
-            # Verify timer changed in state
-            state_msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
-            assert state_msg["payload"]["state"]["job"]["cook-time-seconds"] == 7200
+        # Verify timer changed in state
+        state_msg = loads(await asyncio.wait_for(ws.recv(), timeout=5.0))
+        assert state_msg["payload"]["state"]["job"]["cook-time-seconds"] == 7200
@@ -4,24 +4,18 @@ Tests for Test Control API (Phase 6: CP-06).
 Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 6
 """
 
-import asyncio
-import json
-
-import aiohttp
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.config import Config
 from simulator.control_api import ControlAPI
 from simulator.server import AnovaSimulator
 from simulator.types import DeviceState
+from tests.simulator._json import dumps, loads
+from tests.simulator._ws import connect
+from tests.simulator.conftest import reset_stack
 
-pytestmark = pytest.mark.asyncio(loop_scope="function")
-
-# Unique ports for control API tests
-PORT_WS = 18900
-PORT_CTL = 18901
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 # =============================================================================
@@ -29,20 +23,21 @@ PORT_CTL = 18901
 # =============================================================================
 
 
-@pytest.fixture
-def ctl_config():
+@pytest.fixture(scope="module")
+def ctl_config(module_ports):
     """Configuration for control API tests."""
+    ws_port, ctl_port, _ = module_ports
     return Config(
-        ws_port=PORT_WS,
-        control_port=PORT_CTL,
+        ws_port=ws_port,
+        control_port=ctl_port,
         time_scale=60.0,
         valid_tokens=["test-token"],
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def simulator_with_control(ctl_config):
-    """Start simulator with control API for tests."""
+    """Start simulator with control API once for the module."""
     sim = AnovaSimulator(config=ctl_config)
     await sim.start()
 
@@ -55,6 +50,14 @@ async def simulator_with_control(ctl_config):
     await sim.stop()
 
 
+@pytest.fixture(autouse=True)
+def _reset(simulator_with_control):
+    """Return the shared stack to its initial state at the configured time scale."""
+    sim, control = simulator_with_control
+    reset_stack(sim, control)
+    sim.config.time_scale = 60.0
+
+
 @pytest.fixture
 def ctl_url(ctl_config):
     """Control API base URL."""
@@ -72,8 +75,7 @@ def ws_url(ctl_config):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_ctl01_reset_to_initial_state(simulator_with_control, ctl_url):
+async def test_ctl01_reset_to_initial_state(simulator_with_control, ctl_url, module_http_session):
     """CTL-01: Reset returns state to IDLE and ambient temperature."""
     sim, control = simulator_with_control
 
@@ -83,9 +85,9 @@ async def test_ctl01_reset_to_initial_state(simulator_with_control, ctl_url):
     sim.state.job.target_temperature = 80.0
 
     # Reset via API
-    async with aiohttp.ClientSession() as session, session.post(f"{ctl_url}/reset") as resp:
+    async with module_http_session.post(f"{ctl_url}/reset") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "reset"
         assert data["state"] == "IDLE"
 
@@ -94,31 +96,86 @@ async def test_ctl01_reset_to_initial_state(simulator_with_control, ctl_url):
     assert sim.state.temperature_info.water_temperature == sim.config.ambient_temp
 
 
+async def test_reset_restores_online_and_safety_pins(
+    simulator_with_control, ctl_url, module_http_session
+):
+    """Reset brings the device back online with all safety pins cleared."""
+    sim, control = simulator_with_control
+
+    sim.state.online = False
+    sim.state.pin_info.device_safe = 0
+    sim.state.pin_info.water_leak = 1
+
+    async with module_http_session.post(f"{ctl_url}/reset") as resp:
+        assert resp.status == 200
+
+    assert sim.state.online is True
+    assert sim.state.pin_info.device_safe == 1
+    assert sim.state.pin_info.water_leak == 0
+
+
+async def test_reset_shares_new_state_with_websocket_server(
+    simulator_with_control, ctl_url, ws_url, module_http_session
+):
+    """Reset swaps in a fresh state object that the WebSocket server also serves."""
+    sim, control = simulator_with_control
+    old_state = sim.state
+    old_state.temperature_info.water_temperature = 75.0
+
+    async with module_http_session.post(f"{ctl_url}/reset") as resp:
+        assert resp.status == 200
+
+    assert sim.state is not old_state
+    assert sim.ws_server.state is sim.state
+
+    # New connections get the reset state, not the old object's values
+    async with connect(ws_url) as ws:
+        await ws.recv()  # Device list
+        initial = loads(await ws.recv())
+    water = initial["payload"]["state"]["temperature-info"]["water-temperature"]
+    assert water == sim.config.ambient_temp
+
+
+async def test_reset_clears_message_history(
+    simulator_with_control, ctl_url, ws_url, module_http_session
+):
+    """Reset empties the history served by GET /messages."""
+    sim, control = simulator_with_control
+
+    async with connect(ws_url) as ws:
+        await ws.recv()  # Device list (recorded as outbound)
+    assert sim.ws_server.message_history
+
+    async with module_http_session.post(f"{ctl_url}/reset") as resp:
+        assert resp.status == 200
+
+    async with module_http_session.get(f"{ctl_url}/messages") as resp:
+        data = await resp.json(loads=loads)
+    assert data["count"] == 0
+    assert data["messages"] == []
+
+
 # =============================================================================
 # CTL-02: Set state to COOKING
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_ctl02_set_state_to_cooking(simulator_with_control, ctl_url):
+async def test_ctl02_set_state_to_cooking(simulator_with_control, ctl_url, module_http_session):
     """CTL-02: Set state updates state and physics become active."""
     sim, control = simulator_with_control
 
     # Set state to COOKING via API
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-state",
-            json={
-                "state": "COOKING",
-                "temperature": 65.0,
-                "target_temperature": 65.0,
-                "timer_remaining": 3600,
-            },
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/set-state",
+        json={
+            "state": "COOKING",
+            "temperature": 65.0,
+            "target_temperature": 65.0,
+            "timer_remaining": 3600,
+        },
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "updated"
         assert data["state"] == "COOKING"
 
@@ -130,29 +187,24 @@ async def test_ctl02_set_state_to_cooking(simulator_with_control, ctl_url):
     assert sim.state.job_status.cook_time_remaining == 3600
 
 
-@pytest.mark.asyncio
-async def test_set_state_maintains_job_mode_invariant(simulator_with_control, ctl_url):
+@pytest.mark.parametrize("state", ["PREHEATING", "COOKING", "DONE", "IDLE"])
+async def test_set_state_maintains_job_mode_invariant(
+    state, simulator_with_control, ctl_url, module_http_session
+):
     """Verify job.mode always matches job_status.state (spec Section 4.4 invariant)."""
     sim, control = simulator_with_control
 
-    # Test all state transitions via /set-state
-    states_to_test = ["PREHEATING", "COOKING", "DONE", "IDLE"]
-
-    for state in states_to_test:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(
-                f"{ctl_url}/set-state",
-                json={"state": state},
-            ) as resp,
-        ):
-            assert resp.status == 200
-
-        # Verify invariant: job.mode must equal job_status.state
-        assert sim.state.job_status.state.value == state
-        assert sim.state.job.mode == state, (
-            f"job.mode invariant violated: job_status.state={state}, job.mode={sim.state.job.mode}"
-        )
+    async with module_http_session.post(
+        f"{ctl_url}/set-state",
+        json={"state": state},
+    ) as resp:
+        assert resp.status == 200
+
+    # Verify invariant: job.mode must equal job_status.state
+    assert sim.state.job_status.state.value == state
+    assert sim.state.job.mode == state, (
+        f"job.mode invariant violated: job_status.state={state}, job.mode={sim.state.job.mode}"
+    )
 
 
 # =============================================================================
@@ -160,63 +212,30 @@ async def test_set_state_maintains_job_mode_invariant(simulator_with_control, ct
 # =============================================================================
 
 
-@pytest.fixture
-def ctl03_config():
-    """Configuration for CTL-03 test."""
-    return Config(
-        ws_port=PORT_WS + 10,
-        control_port=PORT_CTL + 10,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def ctl03_setup(ctl03_config):
-    """Setup for CTL-03 test."""
-    sim = AnovaSimulator(config=ctl03_config)
-    await sim.start()
-
-    control = ControlAPI(ctl03_config, sim)
-    await control.start()
-
-    yield sim, control, ctl03_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_ctl03_set_offline_disconnects_clients(ctl03_setup):
+async def test_ctl03_set_offline_disconnects_clients(
+    simulator_with_control, ctl_url, ws_url, module_http_session
+):
     """CTL-03: Set offline disconnects WebSocket clients."""
-    sim, control, config = ctl03_setup
-
-    ctl_url = f"http://localhost:{config.control_port}"
-    ws_url = f"ws://localhost:{config.ws_port}?token=test-token&supportedAccessories=APC"
+    sim, control = simulator_with_control
 
     # Connect a WebSocket client
-    ws = await websockets.connect(ws_url)
+    ws = await connect(ws_url)
     await ws.recv()  # Initial state
 
     # Verify client is connected
     assert len(sim.ws_server.clients) == 1
 
     # Set offline via API
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-offline",
-            json={"offline": True},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/set-offline",
+        json={"offline": True},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "offline"
 
-    # Wait for disconnect
-    await asyncio.sleep(0.1)
-
-    # Verify client was disconnected
+    # Verify client was disconnected (disconnect_all() empties the clients
+    # set before /set-offline responds, so there is nothing to wait for)
     assert len(sim.ws_server.clients) == 0
     assert sim.state.online is False
 
@@ -228,8 +247,7 @@ async def test_ctl03_set_offline_disconnects_clients(ctl03_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_ctl04_set_time_scale(simulator_with_control, ctl_url):
+async def test_ctl04_set_time_scale(simulator_with_control, ctl_url, module_http_session):
     """CTL-04: Set time scale changes physics acceleration."""
     sim, control = simulator_with_control
 
@@ -237,15 +255,12 @@ async def test_ctl04_set_time_scale(simulator_with_control, ctl_url):
     original_scale = sim.config.time_scale
 
     # Set new time scale via API
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-time-scale",
-            json={"time_scale": 120.0},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/set-time-scale",
+        json={"time_scale": 120.0},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "updated"
         assert data["time_scale"] == 120.0
 
@@ -259,28 +274,32 @@ async def test_ctl04_set_time_scale(simulator_with_control, ctl_url):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_ctl05_get_state(simulator_with_control, ctl_url):
+async def test_ctl05_get_state(simulator_with_control, ctl_url, module_http_session, monkeypatch):
     """CTL-05: Get state returns full state JSON."""
     sim, control = simulator_with_control
 
+    # Stop the physics loop from heating the water while the request is served
+    monkeypatch.setattr(sim.config, "heating_rate", 0.0)
+
     # Set some state
     sim.state.job_status.state = DeviceState.PREHEATING
     sim.state.job.target_temperature = 55.0
     sim.state.temperature_info.water_temperature = 30.0
 
     # Get state via API
-    async with aiohttp.ClientSession() as session, session.get(f"{ctl_url}/state") as resp:
+    async with module_http_session.get(f"{ctl_url}/state") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
 
         # Verify structure
-        assert "cooker_id" in data
-        assert "device_type" in data
-        assert "job" in data
-        assert "job_status" in data
-        assert "temperature_info" in data
-        assert "pin_info" in data
+        assert data.keys() >= {
+            "cooker_id",
+            "device_type",
+            "job",
+            "job_status",
+            "temperature_info",
+            "pin_info",
+        }
 
         # Verify values
         assert data["job_status"]["state"] == "PREHEATING"
@@ -293,47 +312,17 @@ async def test_ctl05_get_state(simulator_with_control, ctl_url):
 # =============================================================================
 
 
-@pytest.fixture
-def ctl06_config():
-    """Configuration for CTL-06 test."""
-    return Config(
-        ws_port=PORT_WS + 20,
-        control_port=PORT_CTL + 20,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def ctl06_setup(ctl06_config):
-    """Setup for CTL-06 test."""
-    sim = AnovaSimulator(config=ctl06_config)
-    await sim.start()
-
-    control = ControlAPI(ctl06_config, sim)
-    await control.start()
-
-    yield sim, control, ctl06_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_ctl06_get_messages(ctl06_setup):
+async def test_ctl06_get_messages(simulator_with_control, ctl_url, ws_url, module_http_session):
     """CTL-06: Get messages returns message history."""
-    sim, control, config = ctl06_setup
-
-    ctl_url = f"http://localhost:{config.control_port}"
-    ws_url = f"ws://localhost:{config.ws_port}?token=test-token&supportedAccessories=APC"
+    sim, control = simulator_with_control
 
     # Generate some messages by connecting and sending a command
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         await ws.recv()  # Initial state (outbound)
 
         # Send a command (inbound)
         await ws.send(
-            json.dumps(
+            dumps(
                 {
                     "command": "CMD_APC_START",
                     "requestId": "test-request-1",
@@ -350,9 +339,9 @@ async def test_ctl06_get_messages(ctl06_setup):
         await ws.recv()  # Response (outbound)
 
     # Get messages via API
-    async with aiohttp.ClientSession() as session, session.get(f"{ctl_url}/messages") as resp:
+    async with module_http_session.get(f"{ctl_url}/messages") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
 
         assert "count" in data
         assert "messages" in data
@@ -368,74 +357,65 @@ async def test_ctl06_get_messages(ctl06_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_set_state_invalid_state(simulator_with_control, ctl_url):
+async def test_set_state_invalid_state(simulator_with_control, ctl_url, module_http_session):
     """Set state with invalid state value returns error."""
     sim, control = simulator_with_control
 
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-state",
-            json={"state": "INVALID_STATE"},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/set-state",
+        json={"state": "INVALID_STATE"},
+    ) as resp:
         assert resp.status == 400
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["error"] == "INVALID_STATE"
 
 
-@pytest.mark.asyncio
-async def test_set_time_scale_invalid(simulator_with_control, ctl_url):
+async def test_set_time_scale_invalid(simulator_with_control, ctl_url, module_http_session):
     """Set time scale with invalid value returns error."""
     sim, control = simulator_with_control
 
-    async with aiohttp.ClientSession() as session:
-        # Missing time_scale
-        async with session.post(
-            f"{ctl_url}/set-time-scale",
-            json={},
-        ) as resp:
-            assert resp.status == 400
-            data = await resp.json()
-            assert data["error"] == "MISSING_TIME_SCALE"
-
-        # Negative time_scale
-        async with session.post(
-            f"{ctl_url}/set-time-scale",
-            json={"time_scale": -1},
-        ) as resp:
-            assert resp.status == 400
-            data = await resp.json()
-            assert data["error"] == "INVALID_TIME_SCALE"
-
-
-@pytest.mark.asyncio
-async def test_health_endpoint(simulator_with_control, ctl_url):
+    # Missing time_scale
+    async with module_http_session.post(
+        f"{ctl_url}/set-time-scale",
+        json={},
+    ) as resp:
+        assert resp.status == 400
+        data = await resp.json(loads=loads)
+        assert data["error"] == "MISSING_TIME_SCALE"
+
+    # Negative time_scale
+    async with module_http_session.post(
+        f"{ctl_url}/set-time-scale",
+        json={"time_scale": -1},
+    ) as resp:
+        assert resp.status == 400
+        data = await resp.json(loads=loads)
+        assert data["error"] == "INVALID_TIME_SCALE"
+
+
+async def test_health_endpoint(simulator_with_control, ctl_url, module_http_session):
     """Health endpoint returns status."""
     sim, control = simulator_with_control
 
-    async with aiohttp.ClientSession() as session, session.get(f"{ctl_url}/health") as resp:
+    async with module_http_session.get(f"{ctl_url}/health") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "ok"
         assert data["service"] == "control-api"
         assert "simulator_state" in data
 
 
-@pytest.mark.asyncio
-async def test_get_messages_with_filter(ctl06_setup):
+async def test_get_messages_with_filter(
+    simulator_with_control, ctl_url, ws_url, module_http_session
+):
     """Get messages with direction filter."""
-    sim, control, config = ctl06_setup
-
-    ctl_url = f"http://localhost:{config.control_port}"
-    ws_url = f"ws://localhost:{config.ws_port}?token=test-token&supportedAccessories=APC"
+    sim, control = simulator_with_control
 
     # Generate some messages
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         await ws.recv()  # Initial state
         await ws.send(
-            json.dumps(
+            dumps(
                 {
                     "command": "CMD_APC_START",
                     "requestId": "test-request-2",
@@ -452,11 +432,8 @@ async def test_get_messages_with_filter(ctl06_setup):
         await ws.recv()
 
     # Get only inbound messages
-    async with (
-        aiohttp.ClientSession() as session,
-        session.get(f"{ctl_url}/messages?direction=inbound") as resp,
-    ):
+    async with module_http_session.get(f"{ctl_url}/messages?direction=inbound") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         for msg in data["messages"]:
             assert msg["direction"] == "inbound"
@@ -13,151 +13,163 @@ Reference: docs/SIMULATOR-SPECIFICATION.md
 """
 
 import asyncio
-import json
+import contextlib
+import operator
 
-import aiohttp
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.config import Config
 from simulator.control_api import ControlAPI
 from simulator.server import AnovaSimulator
 from simulator.types import DeviceState
+from tests.simulator._json import dumps, loads
+from tests.simulator._ws import connect
+from tests.simulator.conftest import reset_stack
 
-# Unique ports for edge case tests
-PORT_WS = 19050
-PORT_CTL = 19051
-
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
 
-@pytest.fixture
-def edge_config():
-    """Configuration for edge case tests."""
+@pytest.fixture(scope="module")
+def edge_config(module_ports):
+    """Configuration shared by the edge case tests."""
+    ws_port, ctl_port, _ = module_ports
     return Config(
-        ws_port=PORT_WS,
-        control_port=PORT_CTL,
+        ws_port=ws_port,
+        control_port=ctl_port,
         time_scale=60.0,
         valid_tokens=["test-token"],
+        # The simulator outlives each test; keep periodic state broadcasts from
+        # landing between a command and the frames the test expects
+        broadcast_interval_idle=3600.0,
+        broadcast_interval_cooking=3600.0,
     )
 
 
-@pytest_asyncio.fixture
-async def edge_simulator(edge_config):
-    """Simulator for edge case tests."""
-    sim = AnovaSimulator(config=edge_config)
-    await sim.start()
-    yield sim
-    await sim.stop()
-
-
-@pytest_asyncio.fixture
-async def edge_setup(edge_config):
-    """Simulator with control API for edge case tests."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _edge_stack(edge_config):
+    """Simulator with control API, started once for the module."""
     sim = AnovaSimulator(config=edge_config)
     await sim.start()
 
     control = ControlAPI(edge_config, sim)
     await control.start()
 
-    yield sim, control, edge_config
+    yield sim, control
 
     await control.stop()
     await sim.stop()
 
 
+@pytest.fixture
+def edge_setup(_edge_stack, edge_config):
+    """Shared simulator with control API, reset for each test."""
+    sim, control = _edge_stack
+    reset_stack(sim, control)
+    edge_config.time_scale = 60.0
+    return sim, control, edge_config
+
+
+@pytest.fixture
+def edge_simulator(edge_setup):
+    """Shared simulator, reset for each test."""
+    return edge_setup[0]
+
+
+@pytest.fixture(scope="module")
+def ws_url(edge_config):
+    """WebSocket URL of the shared simulator."""
+    return f"ws://localhost:{edge_config.ws_port}?token=test-token&supportedAccessories=APC"
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def ws(edge_simulator, ws_url):
+    """Connection to the shared simulator with the initial frames already consumed."""
+    async with connect(ws_url) as conn:
+        await conn.recv()  # Device list
+        await conn.recv()  # Initial state
+        yield conn
+
+
+@pytest.fixture(scope="module")
+def ctl_url(edge_config):
+    """Control API base URL of the shared simulator."""
+    return f"http://localhost:{edge_config.control_port}"
+
+
 # =============================================================================
-# PROT-03: Temperature Unit Handling
+# HELPERS
 # =============================================================================
 
 
-@pytest.fixture
-def prot03_config():
-    """Configuration for PROT-03 test."""
-    return Config(
-        ws_port=PORT_WS + 10,
-        control_port=PORT_CTL + 10,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
+async def send_recv(ws, frame: str) -> dict:
+    """Send a pre-encoded command frame and return the decoded reply."""
+    await ws.send(frame)
+    return loads(await ws.recv())
 
 
-@pytest_asyncio.fixture
-async def prot03_simulator(prot03_config):
-    """Simulator for PROT-03 test."""
-    sim = AnovaSimulator(config=prot03_config)
-    await sim.start()
-    yield sim
-    await sim.stop()
+# =============================================================================
+# PROT-03: Temperature Unit Handling
+# =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_prot03_fahrenheit_temperature_handling(prot03_simulator, prot03_config):
+_PROT03_FRAME = dumps(
+    {
+        "command": "CMD_APC_START",
+        "requestId": "test-prot03",
+        "payload": {
+            "targetTemperature": 149.0,
+            "timer": 3600,
+            "unit": "F",
+        },
+    }
+)
+
+
+async def test_prot03_fahrenheit_temperature_handling(edge_simulator, ws):
     """PROT-03: Fahrenheit temperature in request is converted to Celsius in state."""
-    sim = prot03_simulator
-    ws_url = f"ws://localhost:{prot03_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send start command with Fahrenheit temperature
-        # 149°F = 65°C
-        cmd = {
-            "command": "CMD_APC_START",
-            "requestId": "test-prot03",
-            "payload": {
-                "targetTemperature": 149.0,
-                "timer": 3600,
-                "unit": "F",
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
+    sim = edge_simulator
 
-        # Verify state has temperature in Celsius
-        state_update = json.loads(await ws.recv())
-        # Should be approximately 65°C
-        target_temp = state_update["payload"]["state"]["job"]["target-temperature"]
-        assert 64.5 <= target_temp <= 65.5
+    # Send start command with Fahrenheit temperature
+    # 149°F = 65°C
+    response = await send_recv(ws, _PROT03_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
+
+    # Verify state has temperature in Celsius
+    state_update = loads(await ws.recv())
+    # Should be approximately 65°C
+    target_temp = state_update["payload"]["state"]["job"]["target-temperature"]
+    assert 64.5 <= target_temp <= 65.5
+
+
+_PROT03_MIN_FRAME = dumps(
+    {
+        "command": "CMD_APC_START",
+        "requestId": "test-prot03-min",
+        "payload": {
+            "targetTemperature": 100.0,
+            "timer": 3600,
+            "unit": "F",
+        },
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_prot03_fahrenheit_below_minimum(prot03_simulator, prot03_config):
+async def test_prot03_fahrenheit_below_minimum(edge_simulator, ws):
     """PROT-03: Fahrenheit below minimum (104°F) is rejected."""
-    sim = prot03_simulator
-    ws_url = f"ws://localhost:{prot03_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send start command with temperature below minimum in Fahrenheit
-        # 100°F < 104°F minimum
-        cmd = {
-            "command": "CMD_APC_START",
-            "requestId": "test-prot03-min",
-            "payload": {
-                "targetTemperature": 100.0,
-                "timer": 3600,
-                "unit": "F",
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
-        assert "below minimum" in response["payload"]["message"].lower()
+    sim = edge_simulator
+
+    # Send start command with temperature below minimum in Fahrenheit
+    # 100°F < 104°F minimum
+    response = await send_recv(ws, _PROT03_MIN_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
+    assert "below minimum" in response["payload"]["message"].lower()
 
 
 # =============================================================================
@@ -165,167 +177,122 @@ async def test_prot03_fahrenheit_below_minimum(prot03_simulator, prot03_config):
 # =============================================================================
 
 
-@pytest.fixture
-def cmd_config():
-    """Configuration for CMD tests."""
-    return Config(
-        ws_port=PORT_WS + 20,
-        control_port=PORT_CTL + 20,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
+_CMD01_FRAME = dumps(
+    {
+        "command": "CMD_APC_SET_TARGET_TEMP",
+        "requestId": "test-cmd01",
+        "payload": {
+            "targetTemperature": 70.0,
+            "unit": "C",
+        },
+    }
+)
 
 
-@pytest_asyncio.fixture
-async def cmd_simulator(cmd_config):
-    """Simulator for CMD tests."""
-    sim = AnovaSimulator(config=cmd_config)
-    await sim.start()
-    yield sim
-    await sim.stop()
+async def test_cmd01_set_temperature(edge_simulator, ws):
+    """CMD-01: CMD_APC_SET_TARGET_TEMP updates target temperature."""
+    sim = edge_simulator
+
+    # Send set temperature command
+    response = await send_recv(ws, _CMD01_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
 
+    # Verify state updated
+    assert sim.state.job.target_temperature == 70.0
 
-@pytest.mark.asyncio
-async def test_cmd01_set_temperature(cmd_simulator, cmd_config):
-    """CMD-01: CMD_APC_SET_TARGET_TEMP updates target temperature."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send set temperature command
-        cmd = {
-            "command": "CMD_APC_SET_TARGET_TEMP",
-            "requestId": "test-cmd01",
-            "payload": {
-                "targetTemperature": 70.0,
-                "unit": "C",
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
 
-        # Verify state updated
-        assert sim.state.job.target_temperature == 70.0
+_CMD01_F_FRAME = dumps(
+    {
+        "command": "CMD_APC_SET_TARGET_TEMP",
+        "requestId": "test-cmd01-f",
+        "payload": {
+            "targetTemperature": 158.0,
+            "unit": "F",
+        },
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_cmd01_set_temperature_fahrenheit(cmd_simulator, cmd_config):
+async def test_cmd01_set_temperature_fahrenheit(edge_simulator, ws):
     """CMD-01: CMD_APC_SET_TARGET_TEMP works with Fahrenheit."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send set temperature command in Fahrenheit (158°F = 70°C)
-        cmd = {
-            "command": "CMD_APC_SET_TARGET_TEMP",
-            "requestId": "test-cmd01-f",
-            "payload": {
-                "targetTemperature": 158.0,
-                "unit": "F",
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
+    sim = edge_simulator
+
+    # Send set temperature command in Fahrenheit (158°F = 70°C)
+    response = await send_recv(ws, _CMD01_F_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
 
-        # Verify state updated (should be ~70°C)
-        assert 69.5 <= sim.state.job.target_temperature <= 70.5
+    # Verify state updated (should be ~70°C)
+    assert 69.5 <= sim.state.job.target_temperature <= 70.5
 
 
-@pytest.mark.asyncio
-async def test_cmd01_set_temperature_invalid(cmd_simulator, cmd_config):
+_CMD01_INV_FRAME = dumps(
+    {
+        "command": "CMD_APC_SET_TARGET_TEMP",
+        "requestId": "test-cmd01-inv",
+        "payload": {
+            "targetTemperature": 30.0,  # Below minimum
+            "unit": "C",
+        },
+    }
+)
+
+
+async def test_cmd01_set_temperature_invalid(edge_simulator, ws):
     """CMD-01: CMD_APC_SET_TARGET_TEMP rejects invalid temperature."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send invalid temperature
-        cmd = {
-            "command": "CMD_APC_SET_TARGET_TEMP",
-            "requestId": "test-cmd01-inv",
-            "payload": {
-                "targetTemperature": 30.0,  # Below minimum
-                "unit": "C",
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
+    sim = edge_simulator
+
+    # Send invalid temperature
+    response = await send_recv(ws, _CMD01_INV_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
 
 
-@pytest.mark.asyncio
-async def test_cmd02_set_timer(cmd_simulator, cmd_config):
+_CMD02_FRAME = dumps(
+    {
+        "command": "CMD_APC_SET_TIMER",
+        "requestId": "test-cmd02",
+        "payload": {
+            "timer": 7200,
+        },
+    }
+)
+
+
+async def test_cmd02_set_timer(edge_simulator, ws):
     """CMD-02: CMD_APC_SET_TIMER updates timer."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send set timer command
-        cmd = {
-            "command": "CMD_APC_SET_TIMER",
-            "requestId": "test-cmd02",
-            "payload": {
-                "timer": 7200,
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
+    sim = edge_simulator
 
-        # Verify state updated
-        assert sim.state.job.cook_time_seconds == 7200
-        assert sim.state.job_status.cook_time_remaining == 7200
+    # Send set timer command
+    response = await send_recv(ws, _CMD02_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
+
+    # Verify state updated
+    assert sim.state.job.cook_time_seconds == 7200
+    assert sim.state.job_status.cook_time_remaining == 7200
+
+
+_CMD02_INV_FRAME = dumps(
+    {
+        "command": "CMD_APC_SET_TIMER",
+        "requestId": "test-cmd02-inv",
+        "payload": {
+            "timer": 400000,  # Above maximum
+        },
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_cmd02_set_timer_invalid(cmd_simulator, cmd_config):
+async def test_cmd02_set_timer_invalid(edge_simulator, ws):
     """CMD-02: CMD_APC_SET_TIMER rejects invalid timer."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send invalid timer (too long)
-        cmd = {
-            "command": "CMD_APC_SET_TIMER",
-            "requestId": "test-cmd02-inv",
-            "payload": {
-                "timer": 400000,  # Above maximum
-            },
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
+    sim = edge_simulator
+
+    # Send invalid timer (too long)
+    response = await send_recv(ws, _CMD02_INV_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
 
 
 # =============================================================================
@@ -333,29 +300,24 @@ async def test_cmd02_set_timer_invalid(cmd_simulator, cmd_config):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_cmd03_unknown_command(cmd_simulator, cmd_config):
+_CMD03_FRAME = dumps(
+    {
+        "command": "CMD_APC_UNKNOWN",
+        "requestId": "test-cmd03",
+        "payload": {},
+    }
+)
+
+
+async def test_cmd03_unknown_command(edge_simulator, ws):
     """CMD-03: Unknown command returns INVALID_COMMAND error."""
-    sim = cmd_simulator
-    ws_url = f"ws://localhost:{cmd_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Send unknown command
-        cmd = {
-            "command": "CMD_APC_UNKNOWN",
-            "requestId": "test-cmd03",
-            "payload": {},
-        }
-        await ws.send(json.dumps(cmd))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
-        assert response["payload"]["code"] == "INVALID_COMMAND"
+    sim = edge_simulator
+
+    # Send unknown command
+    response = await send_recv(ws, _CMD03_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
+    assert response["payload"]["code"] == "INVALID_COMMAND"
 
 
 # =============================================================================
@@ -363,46 +325,8 @@ async def test_cmd03_unknown_command(cmd_simulator, cmd_config):
 # =============================================================================
 
 
-@pytest.fixture
-def ws01_config():
-    """Configuration for WS-01 test."""
-    return Config(
-        ws_port=PORT_WS + 30,
-        control_port=PORT_CTL + 30,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def ws01_simulator(ws01_config):
-    """Simulator for WS-01 test."""
-    sim = AnovaSimulator(config=ws01_config)
-    await sim.start()
-    yield sim
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_ws01_multiple_concurrent_clients(ws01_simulator, ws01_config):
-    """WS-01: Multiple clients can connect and receive state updates."""
-    sim = ws01_simulator
-    ws_url = f"ws://localhost:{ws01_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    # Connect three clients
-    clients = []
-    for i in range(3):
-        ws = await websockets.connect(ws_url)
-        await ws.recv()  # Device list
-        initial = json.loads(await ws.recv())  # Initial state
-        assert initial["command"] == "EVENT_APC_STATE"
-        clients.append(ws)
-
-    # Verify all clients are connected
-    assert len(sim.ws_server.clients) == 3
-
-    # First client sends a command
-    cmd = {
+_WS01_FRAME = dumps(
+    {
         "command": "CMD_APC_START",
         "requestId": "test-ws01",
         "payload": {
@@ -410,22 +334,41 @@ async def test_ws01_multiple_concurrent_clients(ws01_simulator, ws01_config):
             "timer": 3600,
         },
     }
-    await clients[0].send(json.dumps(cmd))
+)
 
-    # First client should receive response
-    response = json.loads(await clients[0].recv())
-    assert response["command"] == "RESPONSE"
-    assert response["payload"]["status"] == "ok"
 
-    # All clients should receive state broadcast
-    for i, ws in enumerate(clients):
-        state = json.loads(await asyncio.wait_for(ws.recv(), timeout=2.0))
-        assert state["command"] == "EVENT_APC_STATE"
-        assert state["payload"]["state"]["job-status"]["state"] == "PREHEATING"
+async def test_ws01_multiple_concurrent_clients(edge_simulator, ws_url):
+    """WS-01: Multiple clients can connect and receive state updates."""
+    sim = edge_simulator
+
+    # Connect three clients concurrently; the stack closes every client that
+    # connected, even if a later assertion fails
+    async with contextlib.AsyncExitStack() as stack:
+        clients = await asyncio.gather(
+            *(stack.enter_async_context(connect(ws_url)) for _ in range(3))
+        )
+        for ws in clients:
+            await ws.recv()  # Device list
+            initial = loads(await ws.recv())  # Initial state
+            assert initial["command"] == "EVENT_APC_STATE"
+
+        # Verify all clients are connected
+        assert len(sim.ws_server.clients) == 3
+
+        # First client sends a command
+        await clients[0].send(_WS01_FRAME)
+
+        # First client should receive response
+        response = loads(await clients[0].recv())
+        assert response["command"] == "RESPONSE"
+        assert response["payload"]["status"] == "ok"
 
-    # Clean up
-    for ws in clients:
-        await ws.close()
+        # All clients should receive state broadcast (wait on them together)
+        frames = await asyncio.wait_for(asyncio.gather(*(ws.recv() for ws in clients)), timeout=2.0)
+        for raw in frames:
+            state = loads(raw)
+            assert state["command"] == "EVENT_APC_STATE"
+            assert state["payload"]["state"]["job-status"]["state"] == "PREHEATING"
 
 
 # =============================================================================
@@ -433,74 +376,60 @@ async def test_ws01_multiple_concurrent_clients(ws01_simulator, ws01_config):
 # =============================================================================
 
 
-@pytest.fixture
-def sm_config():
-    """Configuration for SM tests."""
-    return Config(
-        ws_port=PORT_WS + 40,
-        control_port=PORT_CTL + 40,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
+_SM02_START_FRAME = dumps(
+    {
+        "command": "CMD_APC_START",
+        "requestId": "test-sm02-start",
+        "payload": {
+            "targetTemperature": 65.0,
+            "timer": 3600,
+        },
+    }
+)
 
-@pytest_asyncio.fixture
-async def sm_simulator(sm_config):
-    """Simulator for SM tests."""
-    sim = AnovaSimulator(config=sm_config)
-    await sim.start()
-    yield sim
-    await sim.stop()
+_SM02_STOP_FRAME = dumps(
+    {
+        "command": "CMD_APC_STOP",
+        "requestId": "test-sm02-stop",
+        "payload": {},
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_sm02_stop_during_preheating(sm_simulator, sm_config):
+async def test_sm02_stop_during_preheating(edge_simulator, ws):
     """SM-02: Stop during PREHEATING returns to IDLE."""
-    sim = sm_simulator
-    ws_url = f"ws://localhost:{sm_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Start cooking
-        start_cmd = {
-            "command": "CMD_APC_START",
-            "requestId": "test-sm02-start",
-            "payload": {
-                "targetTemperature": 65.0,
-                "timer": 3600,
-            },
-        }
-        await ws.send(json.dumps(start_cmd))
-        await ws.recv()  # Response
-        await ws.recv()  # State update
-
-        # Verify PREHEATING
-        assert sim.state.job_status.state == DeviceState.PREHEATING
-
-        # Stop cooking
-        stop_cmd = {
-            "command": "CMD_APC_STOP",
-            "requestId": "test-sm02-stop",
-            "payload": {},
-        }
-        await ws.send(json.dumps(stop_cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
+    sim = edge_simulator
+
+    # Start cooking
+    await ws.send(_SM02_START_FRAME)
+    await ws.recv()  # Response
+    await ws.recv()  # State update
 
-        # Verify IDLE
-        assert sim.state.job_status.state == DeviceState.IDLE
-        assert sim.state.job.mode == "IDLE"
+    # Verify PREHEATING
+    assert sim.state.job_status.state == DeviceState.PREHEATING
+
+    # Stop cooking
+    response = await send_recv(ws, _SM02_STOP_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
+
+    # Verify IDLE
+    assert sim.state.job_status.state == DeviceState.IDLE
+    assert sim.state.job.mode == "IDLE"
+
+
+_SM03_FRAME = dumps(
+    {
+        "command": "CMD_APC_STOP",
+        "requestId": "test-sm03",
+        "payload": {},
+    }
+)
 
 
-@pytest.mark.asyncio
-async def test_sm03_stop_during_cooking_preserves_temp(sm_simulator, sm_config):
+async def test_sm03_stop_during_cooking_preserves_temp(edge_simulator, ws):
     """SM-03: Stop during COOKING returns to IDLE, water temp is preserved."""
-    sim = sm_simulator
+    sim = edge_simulator
 
     # Manually set to COOKING state with hot water
     sim.state.job_status.state = DeviceState.COOKING
@@ -512,30 +441,16 @@ async def test_sm03_stop_during_cooking_preserves_temp(sm_simulator, sm_config):
     sim.state.heater_control.duty_cycle = 100.0
     sim.state.motor_info.rpm = 1200
 
-    ws_url = f"ws://localhost:{sm_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Stop cooking
-        stop_cmd = {
-            "command": "CMD_APC_STOP",
-            "requestId": "test-sm03",
-            "payload": {},
-        }
-        await ws.send(json.dumps(stop_cmd))
-
-        # Get response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "ok"
+    # Stop cooking
+    response = await send_recv(ws, _SM03_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "ok"
 
-        # Verify IDLE
-        assert sim.state.job_status.state == DeviceState.IDLE
+    # Verify IDLE
+    assert sim.state.job_status.state == DeviceState.IDLE
 
-        # Water temperature should still be hot (preserved, will cool naturally)
-        assert sim.state.temperature_info.water_temperature >= 60.0
+    # Water temperature should still be hot (preserved, will cool naturally)
+    assert sim.state.temperature_info.water_temperature >= 60.0
 
 
 # =============================================================================
@@ -543,112 +458,56 @@ async def test_sm03_stop_during_cooking_preserves_temp(sm_simulator, sm_config):
 # =============================================================================
 
 
-@pytest.fixture
-def err_additional_config():
-    """Configuration for additional error tests."""
-    return Config(
-        ws_port=PORT_WS + 50,
-        control_port=PORT_CTL + 50,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def err_additional_setup(err_additional_config):
-    """Setup for additional error tests."""
-    sim = AnovaSimulator(config=err_additional_config)
-    await sim.start()
-
-    control = ControlAPI(err_additional_config, sim)
-    await control.start()
-
-    yield sim, control, err_additional_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_err06_heater_overtemp(err_additional_setup):
-    """ERR-06: Heater overtemp stops cooking and sets device_safe=0."""
-    sim, control, config = err_additional_setup
-    ctl_url = f"http://localhost:{config.control_port}"
+@pytest.mark.parametrize(
+    ("error_type", "expected_effects"),
+    [
+        pytest.param(
+            "heater_overtemp",
+            [
+                ("heater_control.duty_cycle", operator.eq, 0.0),
+                ("temperature_info.heater_temperature", operator.ge, 100.0),
+            ],
+            id="err06_heater_overtemp",
+        ),
+        pytest.param(
+            "triac_overtemp",
+            [("temperature_info.triac_temperature", operator.ge, 80.0)],
+            id="err07_triac_overtemp",
+        ),
+        pytest.param(
+            "water_leak",
+            [("pin_info.water_leak", operator.eq, 1)],
+            id="err08_water_leak",
+        ),
+    ],
+)
+async def test_safety_error_stops_cooking(
+    edge_setup, module_http_session, error_type, expected_effects, ctl_url
+):
+    """ERR-06/07/08: Safety errors stop cooking and set device_safe=0."""
+    sim, control, config = edge_setup
 
     # Set cooking state
     sim.state.job_status.state = DeviceState.COOKING
     sim.state.job.mode = "COOKING"
     sim.state.job.target_temperature = 65.0
+    sim.state.job_status.cook_time_remaining = 3600
 
-    # Trigger heater overtemp
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "heater_overtemp"},
-        ) as resp,
-    ):
+    # Trigger the error
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": error_type},
+    ) as resp:
         assert resp.status == 200
 
     # Verify effects
     assert sim.state.job_status.state == DeviceState.IDLE
     assert sim.state.pin_info.device_safe == 0
-    assert sim.state.heater_control.duty_cycle == 0.0
-    assert sim.state.temperature_info.heater_temperature >= 100.0
-
-
-@pytest.mark.asyncio
-async def test_err07_triac_overtemp(err_additional_setup):
-    """ERR-07: Triac overtemp stops cooking and sets device_safe=0."""
-    sim, control, config = err_additional_setup
-    ctl_url = f"http://localhost:{config.control_port}"
-
-    # Set cooking state
-    sim.state.job_status.state = DeviceState.COOKING
-    sim.state.job.mode = "COOKING"
-    sim.state.job.target_temperature = 65.0
-
-    # Trigger triac overtemp
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "triac_overtemp"},
-        ) as resp,
-    ):
-        assert resp.status == 200
-
-    # Verify effects
-    assert sim.state.job_status.state == DeviceState.IDLE
-    assert sim.state.pin_info.device_safe == 0
-    assert sim.state.temperature_info.triac_temperature >= 80.0
-
-
-@pytest.mark.asyncio
-async def test_err08_water_leak(err_additional_setup):
-    """ERR-08: Water leak stops cooking and sets device_safe=0."""
-    sim, control, config = err_additional_setup
-    ctl_url = f"http://localhost:{config.control_port}"
-
-    # Set cooking state
-    sim.state.job_status.state = DeviceState.COOKING
-    sim.state.job.mode = "COOKING"
-    sim.state.job.target_temperature = 65.0
-
-    # Trigger water leak
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "water_leak"},
-        ) as resp,
-    ):
-        assert resp.status == 200
-
-    # Verify effects
-    assert sim.state.job_status.state == DeviceState.IDLE
-    assert sim.state.pin_info.device_safe == 0
-    assert sim.state.pin_info.water_leak == 1
+    for attr_path, op, expected in expected_effects:
+        actual = operator.attrgetter(attr_path)(sim.state)
+        assert op(actual, expected), (
+            f"{attr_path} = {actual!r}, expected {op.__name__} {expected!r}"
+        )
 
 
 # =============================================================================
@@ -656,66 +515,34 @@ async def test_err08_water_leak(err_additional_setup):
 # =============================================================================
 
 
-@pytest.fixture
-def ctl_config():
-    """Configuration for CTL tests."""
-    return Config(
-        ws_port=PORT_WS + 60,
-        control_port=PORT_CTL + 60,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def ctl_setup(ctl_config):
-    """Setup for CTL tests."""
-    sim = AnovaSimulator(config=ctl_config)
-    await sim.start()
-
-    control = ControlAPI(ctl_config, sim)
-    await control.start()
-
-    yield sim, control, ctl_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_ctl01_set_state_invalid(ctl_setup):
+async def test_ctl01_set_state_invalid(edge_setup, module_http_session, ctl_url):
     """CTL-01: /set-state with invalid state returns 400."""
-    sim, control, config = ctl_setup
-    ctl_url = f"http://localhost:{config.control_port}"
-
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-state",
-            json={"state": "INVALID_STATE"},
-        ) as resp,
-    ):
+    sim, control, config = edge_setup
+
+    async with module_http_session.post(
+        f"{ctl_url}/set-state",
+        json={"state": "INVALID_STATE"},
+    ) as resp:
         assert resp.status == 400
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["error"] == "INVALID_STATE"
 
 
-@pytest.mark.asyncio
-async def test_ctl02_reset_while_cooking(ctl_setup):
+async def test_ctl02_reset_while_cooking(edge_setup, module_http_session, ctl_url):
     """CTL-02: /reset while cooking stops cook and resets state."""
-    sim, control, config = ctl_setup
-    ctl_url = f"http://localhost:{config.control_port}"
+    sim, control, config = edge_setup
 
     # Set cooking state
     sim.state.job_status.state = DeviceState.COOKING
     sim.state.job.mode = "COOKING"
     sim.state.job.target_temperature = 65.0
+    sim.state.job_status.cook_time_remaining = 3600
     sim.state.temperature_info.water_temperature = 65.0
 
     # Reset
-    async with aiohttp.ClientSession() as session, session.post(f"{ctl_url}/reset") as resp:
+    async with module_http_session.post(f"{ctl_url}/reset") as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "reset"
         assert data["state"] == "IDLE"
 
@@ -726,46 +553,36 @@ async def test_ctl02_reset_while_cooking(ctl_setup):
     assert sim.state.temperature_info.water_temperature == sim.config.ambient_temp
 
 
-@pytest.mark.asyncio
-async def test_ctl03_time_scale_limits(ctl_setup):
+async def test_ctl03_time_scale_limits(edge_setup, ctl_url, module_http_session):
     """CTL-03: /set-time-scale rejects invalid time_scale values."""
-    sim, control, config = ctl_setup
-    ctl_url = f"http://localhost:{config.control_port}"
+    sim, control, config = edge_setup
+    url = f"{ctl_url}/set-time-scale"
 
     # Test negative time_scale
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-time-scale",
-            json={"time_scale": -1.0},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        url,
+        json={"time_scale": -1.0},
+    ) as resp:
         assert resp.status == 400
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["error"] == "INVALID_TIME_SCALE"
 
     # Test zero time_scale
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-time-scale",
-            json={"time_scale": 0},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        url,
+        json={"time_scale": 0},
+    ) as resp:
         assert resp.status == 400
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["error"] == "INVALID_TIME_SCALE"
 
     # Test valid time_scale
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/set-time-scale",
-            json={"time_scale": 120.0},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        url,
+        json={"time_scale": 120.0},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "updated"
         assert data["time_scale"] == 120.0
 
@@ -778,67 +595,60 @@ async def test_ctl03_time_scale_limits(ctl_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_stop_when_idle_returns_error(sm_simulator, sm_config):
+_STOP_IDLE_FRAME = dumps(
+    {
+        "command": "CMD_APC_STOP",
+        "requestId": "test-stop-idle",
+        "payload": {},
+    }
+)
+
+
+async def test_stop_when_idle_returns_error(edge_simulator, ws):
     """Stopping when already IDLE returns error."""
-    sim = sm_simulator
-    ws_url = f"ws://localhost:{sm_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Try to stop when idle
-        stop_cmd = {
-            "command": "CMD_APC_STOP",
-            "requestId": "test-stop-idle",
-            "payload": {},
-        }
-        await ws.send(json.dumps(stop_cmd))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
-        assert response["payload"]["code"] == "NO_ACTIVE_COOK"
+    sim = edge_simulator
+
+    # Try to stop when idle
+    response = await send_recv(ws, _STOP_IDLE_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
+    assert response["payload"]["code"] == "NO_ACTIVE_COOK"
+
+
+_START_1_FRAME = dumps(
+    {
+        "command": "CMD_APC_START",
+        "requestId": "test-start-1",
+        "payload": {
+            "targetTemperature": 65.0,
+            "timer": 3600,
+        },
+    }
+)
 
+_START_2_FRAME = dumps(
+    {
+        "command": "CMD_APC_START",
+        "requestId": "test-start-2",
+        "payload": {
+            "targetTemperature": 70.0,
+            "timer": 7200,
+        },
+    }
+)
 
-@pytest.mark.asyncio
-async def test_start_when_already_cooking_returns_error(sm_simulator, sm_config):
+
+async def test_start_when_already_cooking_returns_error(edge_simulator, ws):
     """Starting when already cooking returns DEVICE_BUSY error."""
-    sim = sm_simulator
-    ws_url = f"ws://localhost:{sm_config.ws_port}?token=test-token&supportedAccessories=APC"
-
-    async with websockets.connect(ws_url) as ws:
-        await ws.recv()  # Device list
-        await ws.recv()  # Initial state
-
-        # Start cooking
-        start_cmd = {
-            "command": "CMD_APC_START",
-            "requestId": "test-start-1",
-            "payload": {
-                "targetTemperature": 65.0,
-                "timer": 3600,
-            },
-        }
-        await ws.send(json.dumps(start_cmd))
-        await ws.recv()  # Response
-        await ws.recv()  # State update
-
-        # Try to start again
-        start_cmd2 = {
-            "command": "CMD_APC_START",
-            "requestId": "test-start-2",
-            "payload": {
-                "targetTemperature": 70.0,
-                "timer": 7200,
-            },
-        }
-        await ws.send(json.dumps(start_cmd2))
-
-        # Get error response
-        response = json.loads(await ws.recv())
-        assert response["command"] == "RESPONSE"
-        assert response["payload"]["status"] == "error"
-        assert response["payload"]["code"] == "DEVICE_BUSY"
+    sim = edge_simulator
+
+    # Start cooking
+    await ws.send(_START_1_FRAME)
+    await ws.recv()  # Response
+    await ws.recv()  # State update
+
+    # Try to start again
+    response = await send_recv(ws, _START_2_FRAME)
+    assert response["command"] == "RESPONSE"
+    assert response["payload"]["status"] == "error"
+    assert response["payload"]["code"] == "DEVICE_BUSY"
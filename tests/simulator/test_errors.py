@@ -5,25 +5,22 @@ Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 7
 """
 
 import asyncio
-import json
+import random
 
-import aiohttp
 import pytest
 import pytest_asyncio
-import websockets
 
 from simulator.config import Config
 from simulator.control_api import ControlAPI
 from simulator.errors import ErrorSimulator, ErrorType
 from simulator.server import AnovaSimulator
 from simulator.types import DeviceState
+from tests.simulator._json import loads
+from tests.simulator._ws import connect
+from tests.simulator.conftest import reset_stack, wait_until
 
 # Note: Only async tests should be marked with @pytest.mark.asyncio
 
-# Unique ports for error tests
-PORT_WS = 18950
-PORT_CTL = 18951
-
 
 # =============================================================================
 # ERROR SIMULATOR UNIT TESTS
@@ -39,7 +36,6 @@ class TestErrorSimulator:
         for error_type in ErrorType:
             assert not sim.is_error_active(error_type)
 
-    @pytest.mark.asyncio
     async def test_trigger_and_clear_error(self):
         """Should be able to trigger and clear errors."""
         sim = ErrorSimulator()
@@ -52,7 +48,6 @@ class TestErrorSimulator:
         await sim.clear_error(ErrorType.WATER_LEVEL_LOW)
         assert not sim.is_error_active(ErrorType.WATER_LEVEL_LOW)
 
-    @pytest.mark.asyncio
     async def test_get_active_errors(self):
         """Should return list of active errors."""
         sim = ErrorSimulator()
@@ -65,7 +60,6 @@ class TestErrorSimulator:
         assert ErrorType.MOTOR_STUCK in active
         assert len(active) == 2
 
-    @pytest.mark.asyncio
     async def test_auto_clear_duration(self):
         """Error should auto-clear after duration."""
         sim = ErrorSimulator()
@@ -74,8 +68,7 @@ class TestErrorSimulator:
         assert sim.is_error_active(ErrorType.WATER_LEVEL_LOW)
 
         # Wait for auto-clear
-        await asyncio.sleep(0.2)
-        assert not sim.is_error_active(ErrorType.WATER_LEVEL_LOW)
+        await wait_until(lambda: not sim.is_error_active(ErrorType.WATER_LEVEL_LOW))
 
     def test_intermittent_failure_rate(self):
         """Intermittent failure should respect failure rate."""
@@ -92,6 +85,16 @@ class TestErrorSimulator:
         failures = sum(sim.should_fail_command() for _ in range(100))
         assert failures == 100
 
+    def test_intermittent_failure_seeded_rng(self):
+        """A seeded rng makes intermittent failures repeatable."""
+        sims = [ErrorSimulator(rng=random.Random(42)) for _ in range(2)]
+        for sim in sims:
+            sim._errors[ErrorType.INTERMITTENT_FAILURE].enabled = True
+            sim._errors[ErrorType.INTERMITTENT_FAILURE].failure_rate = 0.5
+
+        first, second = ([sim.should_fail_command() for _ in range(50)] for sim in sims)
+        assert first == second
+
     def test_network_latency(self):
         """Network latency should return configured value."""
         sim = ErrorSimulator()
@@ -110,73 +113,69 @@ class TestErrorSimulator:
 # =============================================================================
 
 
-@pytest.fixture
-def err_config():
+@pytest.fixture(scope="module")
+def err_config(module_ports):
     """Configuration for error tests."""
+    ws_port, ctl_port, _ = module_ports
     return Config(
-        ws_port=PORT_WS,
-        control_port=PORT_CTL,
+        ws_port=ws_port,
+        control_port=ctl_port,
         time_scale=60.0,
         valid_tokens=["test-token"],
+        # The simulator outlives each test; keep periodic state broadcasts from
+        # landing between a command and the frames the test expects
+        broadcast_interval_idle=3600.0,
+        broadcast_interval_cooking=3600.0,
     )
 
 
-@pytest_asyncio.fixture
-async def error_setup(err_config):
-    """Setup simulator with control API for error tests."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _error_stack(err_config):
+    """Simulator with control API, started once for the module."""
     sim = AnovaSimulator(config=err_config)
     await sim.start()
 
     control = ControlAPI(err_config, sim)
     await control.start()
 
-    yield sim, control, err_config
+    yield sim, control
 
     await control.stop()
     await sim.stop()
 
 
-# =============================================================================
-# ERR-01: Device goes offline
-# =============================================================================
-
-
 @pytest.fixture
-def err01_config():
-    """Configuration for ERR-01 test."""
-    return Config(
-        ws_port=PORT_WS + 10,
-        control_port=PORT_CTL + 10,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
+def error_setup(_error_stack, err_config):
+    """Shared simulator with control API, reset (including errors) for each test."""
+    sim, control = _error_stack
+    reset_stack(sim, control)
+    return sim, control, err_config
 
 
-@pytest_asyncio.fixture
-async def err01_setup(err01_config):
-    """Setup for ERR-01 test."""
-    sim = AnovaSimulator(config=err01_config)
-    await sim.start()
+@pytest.fixture(scope="module")
+def ws_url(err_config):
+    """WebSocket URL of the shared simulator."""
+    return f"ws://localhost:{err_config.ws_port}?token=test-token&supportedAccessories=APC"
 
-    control = ControlAPI(err01_config, sim)
-    await control.start()
 
-    yield sim, control, err01_config
+@pytest.fixture(scope="module")
+def ctl_url(err_config):
+    """Control API base URL of the shared simulator."""
+    return f"http://localhost:{err_config.control_port}"
 
-    await control.stop()
-    await sim.stop()
 
+# =============================================================================
+# ERR-01: Device goes offline
+# =============================================================================
 
-@pytest.mark.asyncio
-async def test_err01_device_goes_offline(err01_setup):
-    """ERR-01: Device offline should close WebSocket with 1006."""
-    sim, control, config = err01_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-    ws_url = f"ws://localhost:{config.ws_port}?token=test-token&supportedAccessories=APC"
+@pytest.mark.asyncio(loop_scope="module")
+async def test_err01_device_goes_offline(error_setup, module_http_session, ws_url, ctl_url):
+    """ERR-01: Device offline should close WebSocket with 1006."""
+    sim, control, config = error_setup
 
     # Connect WebSocket client
-    ws = await websockets.connect(ws_url)
+    ws = await connect(ws_url)
     await ws.recv()  # Device list
     await ws.recv()  # Initial state
 
@@ -184,21 +183,16 @@ async def test_err01_device_goes_offline(err01_setup):
     assert len(sim.ws_server.clients) == 1
 
     # Trigger device offline via API
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "device_offline"},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "device_offline"},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["status"] == "triggered"
 
-    # Wait for disconnect
-    await asyncio.sleep(0.1)
-
-    # Client should be disconnected
+    # Client should be disconnected (the error handler awaits disconnect_all(),
+    # which empties the clients set before /trigger-error responds)
     assert len(sim.ws_server.clients) == 0
     assert sim.state.online is False
 
@@ -210,58 +204,26 @@ async def test_err01_device_goes_offline(err01_setup):
 # =============================================================================
 
 
-@pytest.fixture
-def err02_config():
-    """Configuration for ERR-02 test."""
-    return Config(
-        ws_port=PORT_WS + 20,
-        control_port=PORT_CTL + 20,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def err02_setup(err02_config):
-    """Setup for ERR-02 test."""
-    sim = AnovaSimulator(config=err02_config)
-    await sim.start()
-
-    control = ControlAPI(err02_config, sim)
-    await control.start()
-
-    yield sim, control, err02_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_err02_water_level_low_warning(err02_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_err02_water_level_low_warning(error_setup, module_http_session, ws_url, ctl_url):
     """ERR-02: Water level low sets pin-info.water-level-low=1."""
-    sim, control, config = err02_setup
-
-    ctl_url = f"http://localhost:{config.control_port}"
-    ws_url = f"ws://localhost:{config.ws_port}?token=test-token&supportedAccessories=APC"
+    sim, control, config = error_setup
 
     # Connect and verify initial state
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         await ws.recv()  # Device list
-        initial = json.loads(await ws.recv())  # Initial state
+        initial = loads(await ws.recv())  # Initial state
         assert initial["payload"]["state"]["pin-info"]["water-level-low"] == 0
 
         # Trigger water level low
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(
-                f"{ctl_url}/trigger-error",
-                json={"error_type": "water_level_low"},
-            ) as resp,
-        ):
+        async with module_http_session.post(
+            f"{ctl_url}/trigger-error",
+            json={"error_type": "water_level_low"},
+        ) as resp:
             assert resp.status == 200
 
         # Should receive state update with water-level-low=1
-        updated = json.loads(await ws.recv())
+        updated = loads(await ws.recv())
         assert updated["payload"]["state"]["pin-info"]["water-level-low"] == 1
 
 
@@ -270,51 +232,21 @@ async def test_err02_water_level_low_warning(err02_setup):
 # =============================================================================
 
 
-@pytest.fixture
-def err03_config():
-    """Configuration for ERR-03 test."""
-    return Config(
-        ws_port=PORT_WS + 30,
-        control_port=PORT_CTL + 30,
-        time_scale=60.0,
-        valid_tokens=["test-token"],
-    )
-
-
-@pytest_asyncio.fixture
-async def err03_setup(err03_config):
-    """Setup for ERR-03 test."""
-    sim = AnovaSimulator(config=err03_config)
-    await sim.start()
-
-    control = ControlAPI(err03_config, sim)
-    await control.start()
-
-    yield sim, control, err03_config
-
-    await control.stop()
-    await sim.stop()
-
-
-@pytest.mark.asyncio
-async def test_err03_water_level_critical_stops_cooking(err03_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_err03_water_level_critical_stops_cooking(error_setup, module_http_session, ctl_url):
     """ERR-03: Water level critical stops cooking."""
-    sim, control, config = err03_setup
-
-    ctl_url = f"http://localhost:{config.control_port}"
+    sim, control, config = error_setup
 
     # Set state to COOKING
     sim.state.job_status.state = DeviceState.COOKING
     sim.state.job.target_temperature = 65.0
+    sim.state.job_status.cook_time_remaining = 3600
 
     # Trigger water level critical
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "water_level_critical"},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "water_level_critical"},
+    ) as resp:
         assert resp.status == 200
 
     # Verify cooking stopped
@@ -328,23 +260,18 @@ async def test_err03_water_level_critical_stops_cooking(err03_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_err04_network_latency(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_err04_network_latency(error_setup, module_http_session, ctl_url):
     """ERR-04: Network latency can be configured."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-
     # Trigger network latency
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "network_latency", "latency_ms": 500},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "network_latency", "latency_ms": 500},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["latency_ms"] == 500
 
     # Verify latency is set
@@ -356,26 +283,22 @@ async def test_err04_network_latency(error_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_err05_intermittent_failures(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_err05_intermittent_failures(error_setup, module_http_session, ctl_url):
     """ERR-05: Intermittent failures can be configured."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-
     # Trigger intermittent failures with 50% rate
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "intermittent_failure", "failure_rate": 0.5},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "intermittent_failure", "failure_rate": 0.5},
+    ) as resp:
         assert resp.status == 200
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["failure_rate"] == 0.5
 
-    # Verify some commands would fail (statistical test)
+    # Verify some commands would fail (statistical test, seeded so it can't flake)
+    control.error_simulator.rng.seed(1234)
     failures = sum(control.error_simulator.should_fail_command() for _ in range(100))
     # With 50% rate, expect roughly 50 failures (allow 20-80 range)
     assert 20 < failures < 80
@@ -386,96 +309,81 @@ async def test_err05_intermittent_failures(error_setup):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_get_errors_endpoint(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_errors_endpoint(error_setup, module_http_session, ctl_url):
     """GET /errors returns active errors."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
+    async def trigger(error_type: str) -> int:
+        async with module_http_session.post(
+            f"{ctl_url}/trigger-error", json={"error_type": error_type}
+        ) as resp:
+            return resp.status
 
-    # Trigger some errors
-    async with aiohttp.ClientSession() as session:
-        await session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "water_level_low"},
-        )
-        await session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "motor_stuck"},
-        )
+    # Trigger some errors (independent, so sent concurrently)
+    statuses = await asyncio.gather(trigger("water_level_low"), trigger("motor_stuck"))
+    assert statuses == [200, 200]
 
-        # Get errors
-        async with session.get(f"{ctl_url}/errors") as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            assert "water_level_low" in data["active_errors"]
-            assert "motor_stuck" in data["active_errors"]
+    # Get errors
+    async with module_http_session.get(f"{ctl_url}/errors") as resp:
+        assert resp.status == 200
+        data = await resp.json(loads=loads)
+        assert "water_level_low" in data["active_errors"]
+        assert "motor_stuck" in data["active_errors"]
 
 
-@pytest.mark.asyncio
-async def test_clear_error_endpoint(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_clear_error_endpoint(error_setup, module_http_session, ctl_url):
     """POST /clear-error clears an error."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-
-    async with aiohttp.ClientSession() as session:
-        # Trigger error
-        await session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "water_level_low"},
-        )
-        assert control.error_simulator.is_error_active(ErrorType.WATER_LEVEL_LOW)
+    # Trigger error
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "water_level_low"},
+    ) as resp:
+        assert resp.status == 200
+    assert control.error_simulator.is_error_active(ErrorType.WATER_LEVEL_LOW)
 
-        # Clear error
-        async with session.post(
-            f"{ctl_url}/clear-error",
-            json={"error_type": "water_level_low"},
-        ) as resp:
-            assert resp.status == 200
-            data = await resp.json()
-            assert data["status"] == "cleared"
+    # Clear error
+    async with module_http_session.post(
+        f"{ctl_url}/clear-error",
+        json={"error_type": "water_level_low"},
+    ) as resp:
+        assert resp.status == 200
+        data = await resp.json(loads=loads)
+        assert data["status"] == "cleared"
 
-        assert not control.error_simulator.is_error_active(ErrorType.WATER_LEVEL_LOW)
+    assert not control.error_simulator.is_error_active(ErrorType.WATER_LEVEL_LOW)
 
 
-@pytest.mark.asyncio
-async def test_invalid_error_type(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_invalid_error_type(error_setup, module_http_session, ctl_url):
     """Invalid error type returns 400."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "invalid_error"},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "invalid_error"},
+    ) as resp:
         assert resp.status == 400
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         assert data["error"] == "INVALID_ERROR_TYPE"
 
 
-@pytest.mark.asyncio
-async def test_motor_stuck_error(error_setup):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_motor_stuck_error(error_setup, module_http_session, ctl_url):
     """Motor stuck error sets pin-info and stops RPM."""
     sim, control, config = error_setup
 
-    ctl_url = f"http://localhost:{config.control_port}"
-
     # Set some RPM
     sim.state.motor_info.rpm = 1200
 
     # Trigger motor stuck
-    async with (
-        aiohttp.ClientSession() as session,
-        session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "motor_stuck"},
-        ) as resp,
-    ):
+    async with module_http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "motor_stuck"},
+    ) as resp:
         assert resp.status == 200
 
     # Verify state
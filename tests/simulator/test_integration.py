@@ -7,15 +7,14 @@ Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 8
 """
 
 import asyncio
-import json
 
-import aiohttp
 import pytest
-import websockets
 
 from simulator.types import DeviceState
+from tests.simulator._json import dumps, loads
+from tests.simulator._ws import connect
 
-pytestmark = pytest.mark.asyncio(loop_scope="function")
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 # =============================================================================
@@ -23,45 +22,40 @@ pytestmark = pytest.mark.asyncio(loop_scope="function")
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_int01_full_cook_cycle(fast_simulator, fast_config, start_command):
+async def test_int01_full_cook_cycle(fast_simulator, fast_config, ws_command):
     """INT-01: Complete cook cycle works end-to-end."""
     sim = fast_simulator
     ws_url = f"ws://localhost:{fast_config.ws_port}?token=test-token&supportedAccessories=APC"
 
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         # 1. Verify initial IDLE state
         await ws.recv()  # Device list
-        initial = json.loads(await ws.recv())  # Initial state
+        initial = loads(await ws.recv())  # Initial state
         assert initial["command"] == "EVENT_APC_STATE"
         assert initial["payload"]["state"]["job-status"]["state"] == "IDLE"
 
         # 2. Start cooking
-        cmd = start_command(temp=45.0, timer=120)  # Low temp, short timer
-        await ws.send(json.dumps(cmd))
+        cmd = ws_command("start", temp=45.0, timer=120)  # Low temp, short timer
+        await ws.send(dumps(cmd))
 
         # 3. Receive response
-        response = json.loads(await ws.recv())
+        response = loads(await ws.recv())
         assert response["command"] == "RESPONSE"
         assert response["payload"]["status"] == "ok"
 
         # 4. Verify PREHEATING state
-        state_update = json.loads(await ws.recv())
+        state_update = loads(await ws.recv())
         assert state_update["payload"]["state"]["job-status"]["state"] == "PREHEATING"
 
         # 5. Wait for COOKING transition (physics will heat water)
-        for _ in range(100):
-            await asyncio.sleep(0.05)
-            if sim.state.job_status.state == DeviceState.COOKING:
-                break
-        assert sim.state.job_status.state == DeviceState.COOKING
+        await asyncio.wait_for(
+            sim.wait_until(lambda s: s.job_status.state == DeviceState.COOKING), timeout=5.0
+        )
 
         # 6. Wait for DONE transition (timer expires)
-        for _ in range(200):
-            await asyncio.sleep(0.05)
-            if sim.state.job_status.state == DeviceState.DONE:
-                break
-        assert sim.state.job_status.state == DeviceState.DONE
+        await asyncio.wait_for(
+            sim.wait_until(lambda s: s.job_status.state == DeviceState.DONE), timeout=10.0
+        )
 
 
 # =============================================================================
@@ -69,32 +63,30 @@ async def test_int01_full_cook_cycle(fast_simulator, fast_config, start_command)
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_int02a_fixture_isolation_first(simulator, simulator_config, start_command):
+async def test_int02a_fixture_isolation_first(simulator, simulator_config, ws_command):
     """INT-02a: First test modifies state."""
     ws_url = f"ws://localhost:{simulator_config.ws_port}?token=test-token&supportedAccessories=APC"
 
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         await ws.recv()  # Device list
         await ws.recv()  # Initial state
 
         # Start cooking
-        cmd = start_command(temp=65.0, timer=3600)
-        await ws.send(json.dumps(cmd))
+        cmd = ws_command("start", temp=65.0, timer=3600)
+        await ws.send(dumps(cmd))
         await ws.recv()  # Response
 
         # Verify state changed
         assert simulator.state.job_status.state == DeviceState.PREHEATING
 
 
-@pytest.mark.asyncio
 async def test_int02b_fixture_isolation_second(simulator, simulator_config):
     """INT-02b: Second test should have fresh state (isolation)."""
     ws_url = f"ws://localhost:{simulator_config.ws_port}?token=test-token&supportedAccessories=APC"
 
-    async with websockets.connect(ws_url) as ws:
+    async with connect(ws_url) as ws:
         await ws.recv()  # Device list
-        initial = json.loads(await ws.recv())  # Initial state
+        initial = loads(await ws.recv())  # Initial state
 
         # State should be IDLE (fresh), not PREHEATING from previous test
         assert initial["payload"]["state"]["job-status"]["state"] == "IDLE"
@@ -106,22 +98,20 @@ async def test_int02b_fixture_isolation_second(simulator, simulator_config):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_int03_full_stack_integration(full_simulator, start_command):
+async def test_int03_full_stack_integration(full_simulator, ws_command, http_session):
     """INT-03: Full simulator stack (WS + Control + Firebase) works together."""
     sim, control, firebase = full_simulator
     config = sim.config
 
     # 1. Authenticate via Firebase mock
-    async with aiohttp.ClientSession() as session:
-        auth_url = f"http://localhost:{config.firebase_port}/v1/accounts:signInWithPassword"
-        async with session.post(
-            auth_url,
-            json={"email": "test@example.com", "password": "testpassword123"},
-        ) as resp:
-            assert resp.status == 200
-            auth_data = await resp.json()
-            token = auth_data["idToken"]
+    auth_url = f"http://localhost:{config.firebase_port}/v1/accounts:signInWithPassword"
+    async with http_session.post(
+        auth_url,
+        json={"email": "test@example.com", "password": "testpassword123"},
+    ) as resp:
+        assert resp.status == 200
+        auth_data = await resp.json()
+        token = auth_data["idToken"]
 
     # 2. Connect WebSocket with Firebase token
     ws_url = f"ws://localhost:{config.ws_port}?token={token}&supportedAccessories=APC"
@@ -130,21 +120,19 @@ async def test_int03_full_stack_integration(full_simulator, start_command):
     # not Firebase tokens. This test verifies the Firebase mock works independently.
 
     # 3. Verify we can get state via Control API
-    async with aiohttp.ClientSession() as session:
-        state_url = f"http://localhost:{config.control_port}/state"
-        async with session.get(state_url) as resp:
-            assert resp.status == 200
-            state_data = await resp.json()
-            assert state_data["job_status"]["state"] == "IDLE"
+    state_url = f"http://localhost:{config.control_port}/state"
+    async with http_session.get(state_url) as resp:
+        assert resp.status == 200
+        state_data = await resp.json()
+        assert state_data["job_status"]["state"] == "IDLE"
 
     # 4. Use Control API to change state
-    async with aiohttp.ClientSession() as session:
-        set_state_url = f"http://localhost:{config.control_port}/set-state"
-        async with session.post(
-            set_state_url,
-            json={"state": "COOKING", "temperature": 65.0, "target_temperature": 65.0},
-        ) as resp:
-            assert resp.status == 200
+    set_state_url = f"http://localhost:{config.control_port}/set-state"
+    async with http_session.post(
+        set_state_url,
+        json={"state": "COOKING", "temperature": 65.0, "target_temperature": 65.0},
+    ) as resp:
+        assert resp.status == 200
 
     # 5. Verify state changed
     assert sim.state.job_status.state == DeviceState.COOKING
@@ -155,35 +143,34 @@ async def test_int03_full_stack_integration(full_simulator, start_command):
 # =============================================================================
 
 
-@pytest.mark.asyncio
-async def test_websocket_client_fixture(ws_client, start_command, stop_command):
+async def test_websocket_client_fixture(ws_client, ws_command):
     """Test using the ws_client fixture for easy testing."""
     # ws_client is already connected and has consumed initial state
 
     # Start cooking
-    cmd = start_command(temp=60.0, timer=1800)
-    await ws_client.send(json.dumps(cmd))
+    cmd = ws_command("start", temp=60.0, timer=1800)
+    await ws_client.send(dumps(cmd))
 
-    # Get response (might need to skip state broadcasts)
+    # Get response (state broadcasts carry no requestId, so skip them undecoded)
     for _ in range(5):
-        msg = json.loads(await ws_client.recv())
-        if msg["command"] == "RESPONSE":
-            assert msg["payload"]["status"] == "ok"
+        frame = await ws_client.recv()
+        if cmd["requestId"] in frame:
+            assert loads(frame)["payload"]["status"] == "ok"
             break
 
     # Stop cooking
-    await ws_client.send(json.dumps(stop_command()))
+    cmd = ws_command("stop")
+    await ws_client.send(dumps(cmd))
 
-    # Get response (might need to skip state broadcasts)
+    # Get response (state broadcasts carry no requestId, so skip them undecoded)
     for _ in range(5):
-        msg = json.loads(await ws_client.recv())
-        if msg["command"] == "RESPONSE":
-            assert msg["payload"]["status"] == "ok"
+        frame = await ws_client.recv()
+        if cmd["requestId"] in frame:
+            assert loads(frame)["payload"]["status"] == "ok"
             break
 
 
-@pytest.mark.asyncio
-async def test_error_recovery_flow(simulator_with_control, simulator_config):
+async def test_error_recovery_flow(simulator_with_control, simulator_config, http_session):
     """Test error triggering and recovery."""
     sim, control = simulator_with_control
     ctl_url = f"http://localhost:{simulator_config.control_port}"
@@ -192,57 +179,66 @@ async def test_error_recovery_flow(simulator_with_control, simulator_config):
     # Set cooking state
     sim.state.job_status.state = DeviceState.COOKING
     sim.state.job.target_temperature = 65.0
+    sim.state.job_status.cook_time_remaining = 3600  # Don't let the timer expire first
 
-    async with aiohttp.ClientSession() as session:
-        # Trigger water level critical
-        async with session.post(
-            f"{ctl_url}/trigger-error",
-            json={"error_type": "water_level_critical"},
-        ) as resp:
-            assert resp.status == 200
+    # Trigger water level critical
+    async with http_session.post(
+        f"{ctl_url}/trigger-error",
+        json={"error_type": "water_level_critical"},
+    ) as resp:
+        assert resp.status == 200
 
     # Cooking should have stopped
     assert sim.state.job_status.state == DeviceState.IDLE
 
-    async with aiohttp.ClientSession() as session:
-        # Clear the error
-        async with session.post(
-            f"{ctl_url}/clear-error",
-            json={"error_type": "water_level_critical"},
-        ) as resp:
-            assert resp.status == 200
+    # Clear the error
+    async with http_session.post(
+        f"{ctl_url}/clear-error",
+        json={"error_type": "water_level_critical"},
+    ) as resp:
+        assert resp.status == 200
 
     # Device should be safe again
     assert sim.state.pin_info.device_safe == 1
 
 
-@pytest.mark.asyncio
-async def test_command_factory_fixtures(start_command, stop_command):
-    """Test command factory fixtures work correctly."""
+async def test_websocket_client_raw_fixture(ws_client_raw):
+    """ws_client_raw leaves the initial messages for the test to read."""
+    device_list = loads(await ws_client_raw.recv())
+    initial_state = loads(await ws_client_raw.recv())
+
+    assert device_list["command"] == "EVENT_APC_WIFI_LIST"
+    assert initial_state["command"] == "EVENT_APC_STATE"
+
+
+async def test_command_factory_fixture(ws_command):
+    """Test command factory fixture works correctly."""
     # Test start command
-    cmd = start_command(temp=55.0, timer=7200, unit="C")
+    cmd = ws_command("start", temp=55.0, timer=7200, unit="C")
     assert cmd["command"] == "CMD_APC_START"
     assert cmd["payload"]["targetTemperature"] == 55.0
     assert cmd["payload"]["timer"] == 7200
     assert "requestId" in cmd
 
     # Test stop command
-    cmd = stop_command()
+    cmd = ws_command("stop")
     assert cmd["command"] == "CMD_APC_STOP"
     assert "requestId" in cmd
 
 
-@pytest.mark.asyncio
-async def test_state_fixtures(idle_state, cooking_state, preheating_state):
-    """Test state fixtures are properly configured."""
-    # Idle state
-    assert idle_state.job_status.state == DeviceState.IDLE
-
-    # Cooking state
-    assert cooking_state.job_status.state == DeviceState.COOKING
-    assert cooking_state.job.target_temperature == 65.0
-    assert cooking_state.temperature_info.water_temperature == 65.0
-
-    # Preheating state
-    assert preheating_state.job_status.state == DeviceState.PREHEATING
-    assert preheating_state.temperature_info.water_temperature == 35.0
+@pytest.mark.parametrize(
+    ("name", "expected_state", "water_temperature"),
+    [
+        ("idle", DeviceState.IDLE, 22.0),
+        ("cooking", DeviceState.COOKING, 65.0),
+        ("preheating", DeviceState.PREHEATING, 35.0),
+    ],
+)
+async def test_cooker_state_factory(cooker_state, name, expected_state, water_temperature):
+    """Test cooker_state factory builds properly configured states."""
+    state = cooker_state(name)
+
+    assert state.job_status.state == expected_state
+    assert state.temperature_info.water_temperature == water_temperature
+    if expected_state != DeviceState.IDLE:
+        assert state.job.target_temperature == 65.0
@@ -11,35 +11,38 @@ Test cases:
 Reference: docs/SIMULATOR-IMPLEMENTATION-PLAN.md Phase 1
 """
 
-import asyncio
-import json
-
 import pytest
 import pytest_asyncio
-import websockets
 from websockets.exceptions import InvalidStatus
 
 from simulator.config import Config
 from simulator.server import AnovaSimulator
+from tests.simulator._json import loads
+from tests.simulator._ws import connect
+from tests.simulator.conftest import wait_until
 
-# Configure pytest-asyncio
-pytestmark = pytest.mark.asyncio(loop_scope="function")
+# Configure pytest-asyncio: one event loop for the module-scoped simulator
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
     """Test configuration with accelerated time."""
     return Config(
-        ws_port=18765,  # Use non-standard port for tests
+        ws_port=0,  # Picked by the OS when the simulator starts
         time_scale=60.0,
         valid_tokens=["valid-test-token", "another-valid-token"],
         expired_tokens=["expired-test-token"],
+        # The simulator outlives each test; keep periodic state broadcasts from
+        # landing between a command and the frames the test expects
+        broadcast_interval_idle=3600.0,
+        broadcast_interval_cooking=3600.0,
     )
 
 
-@pytest_asyncio.fixture
-async def simulator(config):
-    """Start simulator for tests."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _simulator(config):
+    """Start simulator once for the module."""
     sim = AnovaSimulator(config=config)
     await sim.start()
     yield sim
@@ -47,11 +50,18 @@ async def simulator(config):
 
 
 @pytest.fixture
-def ws_url(config):
+def simulator(_simulator):
+    """Shared simulator, reset for each test."""
+    _simulator.reset()
+    return _simulator
+
+
+@pytest.fixture
+def ws_url(simulator):
     """WebSocket URL builder."""
+    base = f"ws://localhost:{simulator.ws_port}"
 
     def _build(token=None, accessories="APC"):
-        base = f"ws://localhost:{config.ws_port}"
         params = []
         if token:
             params.append(f"token={token}")
@@ -64,18 +74,32 @@ def ws_url(config):
     return _build
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="module")
+async def initial_state(_simulator):
+    """Initial EVENT_APC_STATE from a freshly reset simulator, fetched once per class."""
+    _simulator.reset()
+    url = f"ws://localhost:{_simulator.ws_port}?token=valid-test-token"
+
+    async with connect(url) as ws:
+        # Skip device list (first message)
+        await ws.recv()
+
+        # Get state (second message)
+        msg = await ws.recv()
+        return loads(msg)
+
+
 class TestWebSocketConnection:
     """Test WebSocket connection handling."""
 
-    @pytest.mark.asyncio
     async def test_device_list_sent_on_connection(self, simulator, ws_url):
         """Test simulator sends EVENT_APC_WIFI_LIST immediately on connection."""
         url = ws_url(token="valid-test-token")
 
-        async with websockets.connect(url) as ws:
+        async with connect(url) as ws:
             # First message should be device list
-            msg = await asyncio.wait_for(ws.recv(), timeout=2.0)
-            data = json.loads(msg)
+            msg = await ws.recv()
+            data = loads(msg)
 
             # Verify it's a device list event
             assert data["command"] == "EVENT_APC_WIFI_LIST"
@@ -92,57 +116,64 @@ class TestWebSocketConnection:
             assert device["cookerId"] == simulator.cooker_id
 
             # Second message should be initial state
-            msg2 = await asyncio.wait_for(ws.recv(), timeout=2.0)
-            data2 = json.loads(msg2)
+            msg2 = await ws.recv()
+            data2 = loads(msg2)
             assert data2["command"] == "EVENT_APC_STATE"
 
-    @pytest.mark.asyncio
+    async def test_device_list_follows_device_identity(self, simulator, ws_url):
+        """Cached device list should be rebuilt when the cooker ID changes."""
+        url = ws_url(token="valid-test-token")
+
+        async with connect(url) as ws:
+            first = await ws.recv()
+
+        simulator.state.cooker_id = "anova sim-1111111111"
+
+        async with connect(url) as ws:
+            second = loads(await ws.recv())
+
+        assert loads(first)["payload"][0]["cookerId"] != second["payload"][0]["cookerId"]
+        assert second["payload"][0]["cookerId"] == "anova sim-1111111111"
+
     async def test_ws01_connect_with_valid_token(self, simulator, ws_url):
         """WS-01: Connect with valid token should succeed."""
         url = ws_url(token="valid-test-token")
 
-        async with websockets.connect(url) as ws:
+        async with connect(url) as ws:
             # First message: device list
-            msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            data = json.loads(msg)
+            msg = await ws.recv()
+            data = loads(msg)
             assert data["command"] == "EVENT_APC_WIFI_LIST"
 
             # Second message: initial state
-            msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            data = json.loads(msg)
+            msg = await ws.recv()
+            data = loads(msg)
 
             assert data["command"] == "EVENT_APC_STATE"
             assert "payload" in data
             assert data["payload"]["cookerId"] == simulator.cooker_id
 
-    @pytest.mark.asyncio
-    async def test_ws02_connect_with_invalid_token(self, simulator, ws_url):
-        """WS-02: Connect with invalid token should be rejected."""
-        url = ws_url(token="invalid-token-xyz")
-
-        with pytest.raises(InvalidStatus) as exc_info:
-            async with websockets.connect(url):
-                pass
-
-        assert exc_info.value.response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_ws03_connect_without_token(self, simulator, ws_url):
-        """WS-03: Connect without token should be rejected."""
-        url = ws_url(token=None)
+    @pytest.mark.parametrize(
+        "token",
+        [
+            pytest.param("invalid-token-xyz", id="ws02_invalid_token"),
+            pytest.param(None, id="ws03_no_token"),
+        ],
+    )
+    async def test_connect_rejected(self, simulator, ws_url, token):
+        """WS-02/03: Connect with an invalid or missing token should be rejected."""
+        url = ws_url(token=token)
 
         with pytest.raises(InvalidStatus) as exc_info:
-            async with websockets.connect(url):
-                pass
+            await connect(url)
 
         assert exc_info.value.response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_ws04_send_malformed_json(self, simulator, ws_url):
         """WS-04: Send malformed JSON should return error."""
         url = ws_url(token="valid-test-token")
 
-        async with websockets.connect(url) as ws:
+        async with connect(url) as ws:
             # Consume initial messages (device list + state)
             await ws.recv()  # Device list
             await ws.recv()  # State
@@ -151,19 +182,18 @@ class TestWebSocketConnection:
             await ws.send("not valid json {{{")
 
             # Should receive error response
-            msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            data = json.loads(msg)
+            msg = await ws.recv()
+            data = loads(msg)
 
             assert data["command"] == "RESPONSE"
             assert data["payload"]["status"] == "error"
             assert data["payload"]["code"] == "INVALID_PAYLOAD"
 
-    @pytest.mark.asyncio
     async def test_ws05_graceful_disconnect(self, simulator, ws_url):
         """WS-05: Graceful disconnect should not raise errors."""
         url = ws_url(token="valid-test-token")
 
-        async with websockets.connect(url) as ws:
+        async with connect(url) as ws:
             # Consume initial messages (device list + state)
             await ws.recv()  # Device list
             await ws.recv()  # State
@@ -171,63 +201,40 @@ class TestWebSocketConnection:
             # Client count should be 1
             assert len(simulator.ws_server.clients) == 1
 
-        # After disconnect, client count should be 0
-        await asyncio.sleep(0.1)  # Allow cleanup
-        assert len(simulator.ws_server.clients) == 0
+        # After disconnect, client count should drop to 0
+        await wait_until(lambda: len(simulator.ws_server.clients) == 0)
 
 
 class TestWebSocketInitialState:
     """Test initial state sent on connection."""
 
-    @pytest.mark.asyncio
-    async def test_initial_state_structure(self, simulator, ws_url):
+    async def test_initial_state_structure(self, initial_state):
         """Initial EVENT_APC_STATE should have correct structure."""
-        url = ws_url(token="valid-test-token")
-
-        async with websockets.connect(url) as ws:
-            # Skip device list (first message)
-            await ws.recv()
-
-            # Get state (second message)
-            msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            data = json.loads(msg)
-
-            # Check top-level structure
-            assert data["command"] == "EVENT_APC_STATE"
-            payload = data["payload"]
-            assert "cookerId" in payload
-            assert "type" in payload
-            assert "state" in payload
-
-            # Check state structure
-            state = payload["state"]
-            assert "job" in state
-            assert "job-status" in state
-            assert "temperature-info" in state
-            assert "pin-info" in state
-            assert "heater-control" in state
-
-    @pytest.mark.asyncio
-    async def test_initial_state_values(self, simulator, ws_url):
+        # Check top-level structure
+        assert initial_state["command"] == "EVENT_APC_STATE"
+        payload = initial_state["payload"]
+        assert "cookerId" in payload
+        assert "type" in payload
+        assert "state" in payload
+
+        # Check state structure
+        state = payload["state"]
+        assert "job" in state
+        assert "job-status" in state
+        assert "temperature-info" in state
+        assert "pin-info" in state
+        assert "heater-control" in state
+
+    async def test_initial_state_values(self, initial_state):
         """Initial state should have correct default values."""
-        url = ws_url(token="valid-test-token")
-
-        async with websockets.connect(url) as ws:
-            # Skip device list (first message)
-            await ws.recv()
-
-            # Get state (second message)
-            msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
-            data = json.loads(msg)
-
-            state = data["payload"]["state"]
+        state = initial_state["payload"]["state"]
 
-            # Should be IDLE
-            assert state["job-status"]["state"] == "IDLE"
+        # Should be IDLE
+        assert state["job-status"]["state"] == "IDLE"
 
-            # Temperature should be ambient
-            assert state["temperature-info"]["water-temperature"] == 22.0
+        # Temperature should be ambient
+        assert state["temperature-info"]["water-temperature"] == 22.0
 
-            # Safety should be OK
-            assert state["pin-info"]["device-safe"] == 1
-            assert state["pin-info"]["water-level-low"] == 0
+        # Safety should be OK
+        assert state["pin-info"]["device-safe"] == 1
+        assert state["pin-info"]["water-level-low"] == 0
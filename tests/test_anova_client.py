@@ -169,56 +169,24 @@ def test_initialization_timeout(mock_config):
                 with pytest.raises(AuthenticationError) as exc_info:
                     AnovaWebSocketClient(mock_config)
 
-                assert "timeout" in str(exc_info.value).lower()
+                assert exc_info.value.error_code == "AUTH_TIMEOUT"
 
 
 def test_initialization_connection_error(mock_config):
-    """Test initialization with WebSocket connection error.
+    """Test initialization when the background thread records a connection error."""
 
-    Note: This test verifies the error handling path where connection_error
-    is set during initialization.
-    """
-    # We need to verify that the __init__ method checks connection_error
-    # The actual code only raises if connected.wait() times out OR if connection_error is set
-    # Let's simulate the scenario where thread signals connection with error set
+    def failing_thread(self):
+        # What the connection loop records when websockets.connect() raises
+        self.connection_error = Exception("Connection refused")
 
-    with patch("server.anova_client.websockets.connect") as mock_connect:
-        # Mock connection error
-        mock_connect.side_effect = Exception("Connection refused")
-
-        # Create a custom mock that simulates thread behavior
-        original_init = AnovaWebSocketClient.__init__
-
-        def patched_init(self, config):
-            # Initialize attributes
-            self.config = config
-            self.token = config.PERSONAL_ACCESS_TOKEN
-            self.event_loop = None
-            self.background_thread = None
-            self.websocket = None
-            self.connected = MagicMock()
-            self.connection_error = Exception("Connection refused")
-            self.command_queue = MagicMock()
-            self.response_queue = MagicMock()
-            self.devices = {}
-            self.device_status = {}
-            self.selected_device = None
-            self.status_lock = MagicMock()
-
-            # Simulate connection event being set (but with error)
-            self.connected.wait.return_value = True  # Connection "completes" but has error
-
-            # Check for connection error (this is what the real code does)
-            if self.connection_error:
-                error_msg = f"WebSocket connection failed: {self.connection_error}"
-                raise AuthenticationError(error_msg)
-
-        with patch.object(AnovaWebSocketClient, "__init__", patched_init):
-            # Should raise AuthenticationError
+    with patch.object(
+        AnovaWebSocketClient, "_start_background_thread", autospec=True, side_effect=failing_thread
+    ):
+        with patch.object(AnovaWebSocketClient, "CONNECTION_TIMEOUT", 0.1):
             with pytest.raises(AuthenticationError) as exc_info:
                 AnovaWebSocketClient(mock_config)
 
-            assert "failed" in str(exc_info.value).lower()
+            assert exc_info.value.error_code == "AUTH_CONNECT_FAILED"
 
 
 # ==============================================================================
@@ -484,7 +452,7 @@ def test_get_status_no_device(mock_config):
         with pytest.raises(DeviceOfflineError) as exc_info:
             client.get_status()
 
-        assert "no device" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "NO_DEVICE"
 
 
 # ==============================================================================
@@ -570,7 +538,7 @@ def test_start_cook_device_offline(mock_config):
         with pytest.raises(DeviceOfflineError) as exc_info:
             client.start_cook(temperature_c=65.0, time_minutes=90)
 
-        assert "no device" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "NO_DEVICE"
 
 
 def test_start_cook_device_busy(mock_config):
@@ -596,7 +564,7 @@ def test_start_cook_device_busy(mock_config):
         with pytest.raises(DeviceBusyError) as exc_info:
             client.start_cook(temperature_c=65.0, time_minutes=90)
 
-        assert "already cooking" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "ALREADY_COOKING"
 
 
 def test_start_cook_timeout(mock_config):
@@ -632,7 +600,7 @@ def test_start_cook_timeout(mock_config):
             with pytest.raises(AnovaAPIError) as exc_info:
                 client.start_cook(temperature_c=65.0, time_minutes=90)
 
-        assert "timeout" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "START_TIMEOUT"
         assert exc_info.value.status_code == 504
 
 
@@ -717,7 +685,7 @@ def test_stop_cook_no_active_cook(mock_config):
         with pytest.raises(NoActiveCookError) as exc_info:
             client.stop_cook()
 
-        assert "no active cook" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "NO_ACTIVE_COOK"
 
 
 def test_stop_cook_device_offline(mock_config):
@@ -731,7 +699,7 @@ def test_stop_cook_device_offline(mock_config):
         with pytest.raises(DeviceOfflineError) as exc_info:
             client.stop_cook()
 
-        assert "no device" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "NO_DEVICE"
 
 
 def test_stop_cook_timeout(mock_config):
@@ -767,7 +735,7 @@ def test_stop_cook_timeout(mock_config):
             with pytest.raises(AnovaAPIError) as exc_info:
                 client.stop_cook()
 
-        assert "timeout" in str(exc_info.value).lower()
+        assert exc_info.value.error_code == "STOP_TIMEOUT"
         assert exc_info.value.status_code == 504
 
 
@@ -0,0 +1,107 @@
+"""
+Smoke tests for the Anova Cloud API mocks.
+
+No other test imports tests/mocks yet, so these keep the fixtures and
+payloads from rotting:
+- Every mock fixture registers responses whose bodies decode as JSON
+- Every PAYLOADS entry resolves to a real anova_responses attribute
+- Error payloads are plain, JSON-serializable dicts
+
+Reference: tests/mocks/anova_fixtures.py, tests/mocks/anova_responses.py
+"""
+
+import json
+
+import pytest
+import responses
+
+from tests.mocks import anova_fixtures, anova_responses
+from tests.mocks.anova_fixtures import (  # noqa: F401 - fixtures looked up by name below
+    mock_anova_api_busy,
+    mock_anova_api_offline,
+    mock_anova_api_stop_without_cook,
+    mock_anova_api_success,
+    mock_connection_lost_during_cook,
+    mock_device_start_cook_success,
+    mock_device_status_cooking,
+    mock_device_status_idle,
+    mock_device_status_preheating,
+    mock_device_stop_cook_success,
+    mock_firebase_auth_success,
+    mock_firebase_token_refresh,
+    mock_state_progression_cooking_to_done,
+    mock_state_progression_cooking_to_idle,
+    mock_state_progression_idle_to_cooking,
+    mock_token_expired_then_refreshed,
+)
+
+MOCK_FIXTURES = [
+    "mock_firebase_auth_success",
+    "mock_firebase_token_refresh",
+    "mock_device_status_idle",
+    "mock_device_status_preheating",
+    "mock_device_status_cooking",
+    "mock_device_start_cook_success",
+    "mock_device_stop_cook_success",
+    "mock_anova_api_success",
+    "mock_anova_api_offline",
+    "mock_anova_api_busy",
+    "mock_anova_api_stop_without_cook",
+    "mock_token_expired_then_refreshed",
+    "mock_state_progression_idle_to_cooking",
+    "mock_state_progression_cooking_to_done",
+    "mock_state_progression_cooking_to_idle",
+    "mock_connection_lost_during_cook",
+]
+
+ERROR_PAYLOADS = ["ERROR_UNAUTHORIZED", "ERROR_RATE_LIMITED", "ERROR_INTERNAL_SERVER"]
+
+
+# ==============================================================================
+# FIXTURE TESTS
+# ==============================================================================
+
+
+@pytest.mark.parametrize("fixture_name", MOCK_FIXTURES)
+@responses.activate
+def test_fixture_registers_json_bodies(request, fixture_name):
+    """Each mock fixture should register responses with JSON object bodies."""
+    request.getfixturevalue(fixture_name)()
+
+    registered = responses.registered()
+    assert registered
+    for response in registered:
+        assert response.content_type == "application/json"
+        assert isinstance(json.loads(response.body), dict)
+
+
+# ==============================================================================
+# PAYLOAD TESTS
+# ==============================================================================
+
+
+@pytest.mark.parametrize("json_key", sorted(anova_fixtures.PAYLOADS))
+def test_payload_key_resolves(json_key):
+    """Each PAYLOADS entry should name an anova_responses attribute and encode."""
+    body = json.loads(anova_fixtures._encoded_body(json_key))
+    expected = getattr(anova_responses, anova_fixtures.PAYLOADS[json_key])
+
+    assert body == {**expected, **anova_fixtures.PAYLOAD_OVERRIDES.get(json_key, {})}
+
+
+def test_auth_expiring_overrides_expiry():
+    """auth_expiring should expire immediately without touching the base payload."""
+    body = json.loads(anova_fixtures._encoded_body("auth_expiring"))
+
+    assert body["expiresIn"] == "0"
+    assert anova_responses.FIREBASE_AUTH_SUCCESS["expiresIn"] == "3600"
+
+
+@pytest.mark.parametrize("name", ERROR_PAYLOADS)
+def test_error_payload_serializes(name):
+    """Error payloads should be plain dicts that round-trip through json."""
+    payload = getattr(anova_responses, name)
+
+    assert type(payload) is dict
+    assert json.loads(json.dumps(payload)) == payload
+    assert payload["code"]